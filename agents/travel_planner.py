@@ -4,17 +4,23 @@ Travel Planner Agent
 An agentic AI system that creates travel itineraries using LLM models.
 """
 
+import hashlib
 import json
 import re
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from typing import Optional
 from enum import Enum
+from functools import lru_cache
 
+# Use orjson for parsing model responses when available
 try:
-    from openai import OpenAI
+    from orjson import loads as json_loads
 except ImportError:
-    print("Please install openai: pip install openai")
-    exit(1)
+    json_loads = json.loads
 
 import sys
 import os
@@ -26,14 +32,55 @@ from config.settings import (
     OPENROUTER_API_KEY, 
     OPENROUTER_BASE_URL, 
     DEFAULT_MODEL,
+    CHEAP_MODEL,
+    STRONG_MODEL,
     MAX_REPLANNING_ATTEMPTS,
     HOURS_PER_DAY,
     BUDGET_UTILIZATION_TARGET,
     MIN_DAILY_SPEND_RATIO,
-    MAX_TOKENS
+    MAX_TOKENS,
+    MAX_CONCURRENT_LLM_CALLS,
+    MAX_PREVIOUS_ACTIVITIES,
+    LLM_MAX_RETRIES,
+    LLM_CACHE_SIZE,
+    LLM_CACHE_TTL,
+    BUDGET_CACHE_BUCKET,
+    FALLBACK_BUDGET_BUCKET,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_KEEPALIVE_EXPIRY,
+    REDIS_URL
 )
 
 
+# ============================================================================
+# Prompts
+# ============================================================================
+
+# Kept byte-identical across calls so providers can reuse the cached prefix.
+# All static instructions (including the JSON schema) live here; per-day
+# prompts only carry the values that change.
+SYSTEM_PROMPT = """You are a travel planner. Respond ONLY with valid JSON. Create premium activities in Indian Rupees (₹).
+JSON format: {"activities": [{"name": "string", "description": "short", "duration_hours": float, "cost": float, "activity_type": "sightseeing|adventure|cultural|food|relaxation|shopping|nightlife", "time_slot": "morning|afternoon|evening"}]}"""
+
+# User prompt templates, filled with str.format_map
+ITINERARY_PROMPT_TEMPLATE = """{num_days}-day trip to {city}. Budget per day: ₹{budget:.0f}. Preferences: {preferences}. {hours}h available per day.
+Generate 3-4 activities for each day without repeating activities across days.
+Wrap the days as: {{"days": [{{"day": 1, "activities": [...]}}, ...]}} covering days 1-{num_days}."""
+
+DAY_PROMPT_TEMPLATE = """Day {day} in {city}. Budget: ₹{budget:.0f}. Preferences: {preferences}. {hours}h available.{previous}
+Generate 3-4 activities."""
+
+REPLAN_PROMPT_TEMPLATE = """Day {day} in {city} failed validation: {error}. Previous plan: ₹{previous_cost:.0f}, {previous_hours:.1f}h.
+New plan: strictly under ₹{budget:.0f}, max {hours}h, 3-4 activities. Preferences: {preferences}."""
+
+# Models that need an explicit cache breakpoint; others cache prefixes automatically
+EXPLICIT_CACHE_MODEL_PREFIXES = ("anthropic/",)
+
+# Decoder used to pull JSON out of free-form model responses
+_JSON_DECODER = json.JSONDecoder()
+_JSON_START_RE = re.compile(r'[\[{]')
+
+
 # ============================================================================
 # Data Models
 # ============================================================================
@@ -48,7 +95,7 @@ class ActivityType(Enum):
     NIGHTLIFE = "nightlife"
 
 
-@dataclass
+@dataclass(slots=True)
 class Activity:
     """Represents a single activity in the itinerary"""
     name: str
@@ -59,7 +106,22 @@ class Activity:
     time_slot: str  # morning, afternoon, evening
 
 
-@dataclass
+# Chronological order of time slots; unknown slots sort with the afternoon
+TIME_SLOT_ORDER = {"morning": 0, "afternoon": 1, "evening": 2}
+
+
+def sort_by_time_slot(activities: list[Activity]) -> list[Activity]:
+    """Activities in chronological time-slot order, stable within a slot.
+    
+    Three fixed slots, so bucketing is a single pass with no key calls.
+    """
+    buckets = ([], [], [])
+    for activity in activities:
+        buckets[TIME_SLOT_ORDER.get(activity.time_slot, 1)].append(activity)
+    return buckets[0] + buckets[1] + buckets[2]
+
+
+@dataclass(slots=True)
 class DayPlan:
     """Represents a single day's plan"""
     day_number: int
@@ -71,9 +133,20 @@ class DayPlan:
         self.activities.append(activity)
         self.total_cost += activity.cost
         self.total_hours += activity.duration_hours
+    
+    def set_activities(self, activities: list[Activity]):
+        """Replace the activities and recompute both totals in one pass"""
+        total_cost = 0.0
+        total_hours = 0.0
+        for activity in activities:
+            total_cost += activity.cost
+            total_hours += activity.duration_hours
+        self.activities = activities
+        self.total_cost = total_cost
+        self.total_hours = total_hours
 
 
-@dataclass
+@dataclass(slots=True)
 class TravelPlan:
     """Complete travel plan with all days"""
     city: str
@@ -83,12 +156,16 @@ class TravelPlan:
     days: list[DayPlan] = field(default_factory=list)
     total_cost: float = 0.0
     
+    def add_day(self, day: DayPlan):
+        self.days.append(day)
+        self.total_cost += day.total_cost
+    
     def calculate_total_cost(self) -> float:
-        self.total_cost = sum(day.total_cost for day in self.days)
+        # Kept up to date by add_day and the global budget optimization
         return self.total_cost
 
 
-@dataclass
+@dataclass(slots=True)
 class UserInput:
     """User input for travel planning"""
     budget: float
@@ -97,29 +174,216 @@ class UserInput:
     activity_preferences: list[str]
 
 
+# ============================================================================
+# Streaming Helpers
+# ============================================================================
+
+class _JsonCompletionTracker:
+    """Detects, chunk by chunk, when the first top-level JSON value closes"""
+    
+    __slots__ = ('depth', 'started', 'in_string', 'escaped')
+    
+    def __init__(self):
+        self.depth = 0
+        self.started = False
+        self.in_string = False
+        self.escaped = False
+    
+    def feed(self, text: str) -> bool:
+        for ch in text:
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif ch == '\\':
+                    self.escaped = True
+                elif ch == '"':
+                    self.in_string = False
+            elif ch in '{[':
+                self.depth += 1
+                self.started = True
+            elif not self.started:
+                continue
+            elif ch == '"':
+                self.in_string = True
+            elif ch in '}]':
+                self.depth -= 1
+                if self.depth == 0:
+                    return True
+        return False
+
+
+# ============================================================================
+# Completion Cache
+# ============================================================================
+
+_redis_client = None
+_redis_checked = False
+
+
+def get_redis_client():
+    """Return a shared Redis client when REDIS_URL is set and redis is installed"""
+    global _redis_client, _redis_checked
+    if not _redis_checked:
+        _redis_checked = True
+        if REDIS_URL:
+            try:
+                import redis
+                _redis_client = redis.Redis.from_url(REDIS_URL, socket_timeout=1)
+            except ImportError:
+                print("⚠️ REDIS_URL is set but redis is not installed; using in-process caches")
+    return _redis_client
+
+
+class CompletionCache:
+    """Thread-safe in-memory LRU cache of LLM completions with a TTL, optionally backed by Redis"""
+    
+    REDIS_PREFIX = "travelcraft:llm:"
+    
+    def __init__(self, maxsize: int = LLM_CACHE_SIZE, ttl: float = LLM_CACHE_TTL, redis_client=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.redis = redis_client
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def make_key(model: str, system_prompt: Optional[str], prompt: str) -> str:
+        raw = "\x00".join((model, system_prompt or "", prompt))
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at >= time.monotonic():
+                    self._entries.move_to_end(key)
+                    return value
+                del self._entries[key]
+        
+        if self.redis is None or self.maxsize <= 0:
+            return None
+        try:
+            value = self.redis.get(self.REDIS_PREFIX + key)
+        except Exception as e:
+            print(f"⚠️ Redis cache read failed: {e}")
+            return None
+        if value is None:
+            return None
+        value = value.decode("utf-8")
+        self._set_local(key, value)
+        return value
+    
+    def set(self, key: str, value: str):
+        if self.maxsize <= 0:
+            return
+        self._set_local(key, value)
+        if self.redis is not None:
+            try:
+                self.redis.setex(self.REDIS_PREFIX + key, int(self.ttl), value)
+            except Exception as e:
+                print(f"⚠️ Redis cache write failed: {e}")
+    
+    def _set_local(self, key: str, value: str):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+# Shared by every agent so repeated plans reuse completions (across workers with Redis)
+completion_cache = CompletionCache(redis_client=get_redis_client())
+
+
 # ============================================================================
 # LLM Model Interface (OpenRouter)
 # ============================================================================
 
+# The OpenAI SDK is slow to import, so it is loaded on first agent creation
+_OpenAI = None
+_httpx = None
+
+
+def _load_openai():
+    """Import and memoize the OpenAI client class and httpx module"""
+    global _OpenAI, _httpx
+    if _OpenAI is None:
+        try:
+            import httpx
+            from openai import OpenAI
+        except ImportError as e:
+            raise ImportError("Please install openai: pip install openai") from e
+        _OpenAI, _httpx = OpenAI, httpx
+    return _OpenAI, _httpx
+
+
+@lru_cache(maxsize=None)
+def _http2_available() -> bool:
+    """HTTP/2 lets concurrent day requests share one connection (needs h2)"""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+@lru_cache(maxsize=None)
+def _get_openai_client(base_url: str, api_key: str):
+    """One OpenAI client (and connection pool) per process for each endpoint and key"""
+    OpenAI, httpx = _load_openai()
+    return OpenAI(
+        base_url=base_url,
+        api_key=api_key,
+        # Transient rate limits and server errors are retried by the SDK
+        # before a call gives up and the fallback activities are used
+        max_retries=LLM_MAX_RETRIES,
+        # Keep connections to OpenRouter warm between requests
+        http_client=httpx.Client(
+            http2=_http2_available(),
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_CONNECTIONS,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY
+            )
+        ),
+    )
+
+
 class LlamaAgent:
     """Interface to interact with LLM models via OpenRouter API"""
     
     def __init__(self, model_name: str = None):
         self.model_name = model_name or DEFAULT_MODEL
         self.conversation_history = []
-        self.client = OpenAI(
-            base_url=OPENROUTER_BASE_URL,
-            api_key=OPENROUTER_API_KEY,
-        )
+        self.client = _get_openai_client(OPENROUTER_BASE_URL, OPENROUTER_API_KEY)
+        
+    def query(
+        self,
+        prompt: str,
+        system_prompt: str = None,
+        max_tokens: int = None,
+        model: str = None,
+        json_mode: bool = False
+    ) -> str:
+        """Send a query to the LLM model via OpenRouter.
+        
+        With json_mode the model is constrained to emit a bare JSON object,
+        so extract_json can parse it without searching for braces, and the
+        stream is cut off as soon as that object is complete.
+        """
+        model = model or self.model_name
+        cache_key = CompletionCache.make_key(model, system_prompt, prompt)
+        cached = completion_cache.get(cache_key)
+        if cached is not None:
+            return cached
         
-    def query(self, prompt: str, system_prompt: str = None) -> str:
-        """Send a query to the LLM model via OpenRouter"""
         messages = []
         
         if system_prompt:
             messages.append({
                 "role": "system",
-                "content": system_prompt
+                "content": self._system_content(system_prompt, model)
             })
         
         messages.append({
@@ -127,36 +391,134 @@ class LlamaAgent:
             "content": prompt
         })
         
+        extra_params = {}
+        if json_mode:
+            extra_params["response_format"] = {"type": "json_object"}
+        
         try:
-            response = self.client.chat.completions.create(
-                model=self.model_name,
+            stream = self.client.chat.completions.create(
+                model=model,
                 messages=messages,
                 temperature=0.7,
-                max_tokens=MAX_TOKENS
+                max_tokens=max_tokens or MAX_TOKENS,
+                stream=True,
+                # Token usage (including cached prompt tokens) arrives in a final chunk
+                stream_options={"include_usage": True},
+                **extra_params
             )
-            return response.choices[0].message.content
+            tracker = _JsonCompletionTracker() if json_mode else None
+            json_closed = False
+            usage = None
+            parts = []
+            with stream:
+                for chunk in stream:
+                    usage = getattr(chunk, 'usage', None) or usage
+                    if not chunk.choices:
+                        continue
+                    text = chunk.choices[0].delta.content
+                    if not text:
+                        continue
+                    # Text after the closed JSON is prose; stop generation there.
+                    # Trailing empty chunks (finish reason, usage) are still read.
+                    if json_closed:
+                        break
+                    parts.append(text)
+                    if tracker and tracker.feed(text):
+                        json_closed = True
+            if usage is not None:
+                self._log_cache_usage(usage)
+            content = "".join(parts)
+            # Only cache completions that parse, so a truncated or prose reply
+            # isn't replayed to every identical prompt for the cache TTL
+            if content and isinstance(self.extract_json(content), dict):
+                completion_cache.set(cache_key, content)
+            return content or None
         except Exception as e:
             print(f"Error querying LLM model: {e}")
             return None
     
+    def _system_content(self, system_prompt: str, model: str):
+        """Mark the static system prompt as cacheable for models that need it"""
+        if model.startswith(EXPLICIT_CACHE_MODEL_PREFIXES):
+            return [{
+                "type": "text",
+                "text": system_prompt,
+                "cache_control": {"type": "ephemeral"}
+            }]
+        return system_prompt
+    
+    def _log_cache_usage(self, usage):
+        """Report how many prompt tokens were served from the provider cache"""
+        details = getattr(usage, 'prompt_tokens_details', None)
+        cached = getattr(details, 'cached_tokens', None) or getattr(usage, 'cache_read_input_tokens', None)
+        if cached:
+            print(f"   💾 Prompt cache hit: {cached}/{usage.prompt_tokens} tokens")
+    
     def extract_json(self, response: str) -> Optional[dict]:
-        """Extract JSON from model response"""
+        """Extract the first JSON object from a model response.
+        
+        Returns None when the response holds no object; bare scalars and
+        arrays are never returned, so callers can index the result.
+        """
         try:
-            # Try to find JSON in the response
-            json_match = re.search(r'\{[\s\S]*\}', response)
-            if json_match:
-                return json.loads(json_match.group())
-            
-            # Try to find JSON array
-            json_match = re.search(r'\[[\s\S]*\]', response)
-            if json_match:
-                return json.loads(json_match.group())
-                
+            # JSON-mode responses are already bare JSON
+            data = json_loads(response)
+            if isinstance(data, dict):
+                return data
         except json.JSONDecodeError:
             pass
+        
+        # Decode from each opening brace/bracket in turn; linear per attempt
+        # and no regex backtracking over the body
+        match = _JSON_START_RE.search(response)
+        while match:
+            try:
+                data = _JSON_DECODER.raw_decode(response, match.start())[0]
+                if isinstance(data, dict):
+                    return data
+            except json.JSONDecodeError:
+                pass
+            match = _JSON_START_RE.search(response, match.start() + 1)
         return None
 
 
+def _bucket_budget(amount: float, bucket_size: float = BUDGET_CACHE_BUCKET) -> float:
+    """Round a budget down to a cache bucket so near-identical inputs match.
+    
+    Never rounds up (the model must not see more than it can spend) and never
+    rounds a small budget down to zero; those are passed through unbucketed.
+    """
+    bucket = (amount // bucket_size) * bucket_size
+    return bucket if bucket > 0 else amount
+
+
+@lru_cache(maxsize=256)
+def _fallback_activity_fields(city: str, daily_budget: float) -> tuple[tuple, ...]:
+    """Field values for the fallback activities, memoized per city and budget"""
+    return (
+        (
+            f"Premium {city} Guided Tour",
+            f"Expert-led tour of {city}'s top attractions with skip-the-line access",
+            3.0, daily_budget * 0.30, "sightseeing", "morning"
+        ),
+        (
+            f"Fine Dining at Top {city} Restaurant",
+            "Michelin-recommended restaurant experience with local specialties",
+            2.0, daily_budget * 0.25, "food", "afternoon"
+        ),
+        (
+            f"{city} Cultural Experience & Show",
+            f"Traditional performance or cultural show unique to {city}",
+            2.5, daily_budget * 0.25, "cultural", "evening"
+        ),
+        (
+            f"Exclusive {city} Night Tour",
+            f"Private evening tour showcasing {city}'s illuminated landmarks",
+            2.0, daily_budget * 0.20, "nightlife", "evening"
+        ),
+    )
+
+
 # ============================================================================
 # Travel Planner Agent
 # ============================================================================
@@ -169,114 +531,146 @@ class TravelPlannerAgent:
     
     def __init__(self, model_name: str = None):
         self.llama = LlamaAgent(model_name)
+        # Plan with the cheap model first; escalate to the strong one on failure
+        self.cheap_model = model_name or CHEAP_MODEL
+        self.strong_model = model_name or STRONG_MODEL
         self.max_replanning_attempts = MAX_REPLANNING_ATTEMPTS
         self.hours_per_day = HOURS_PER_DAY
         self.budget_utilization_target = BUDGET_UTILIZATION_TARGET
         self.min_daily_spend_ratio = MIN_DAILY_SPEND_RATIO
+        self.max_concurrent_calls = MAX_CONCURRENT_LLM_CALLS
+        self.max_previous_activities = MAX_PREVIOUS_ACTIVITIES
         
     def get_system_prompt(self) -> str:
         """System prompt for the travel planning agent"""
-        return """You are a travel planner. Respond ONLY with valid JSON. Create premium activities in Indian Rupees (₹).
-JSON format: {"activities": [{"name": "string", "description": "short", "duration_hours": float, "cost": float, "activity_type": "sightseeing|adventure|cultural|food|relaxation|shopping|nightlife", "time_slot": "morning|afternoon|evening"}]}"""
+        return SYSTEM_PROMPT
+    
+    def generate_full_itinerary(
+        self, user_input: UserInput, daily_budget: float, preferences: str
+    ) -> dict[int, list[Activity]]:
+        """Generate activities for every day in a single LLM call.
+        
+        Returns a mapping of day number to activities; days the model
+        skipped or returned unparseable are left out for the caller to fill.
+        """
+        num_days = user_input.num_days
+        target_daily_spend = _bucket_budget(daily_budget) * self.budget_utilization_target
+        
+        prompt = ITINERARY_PROMPT_TEMPLATE.format_map({
+            'num_days': num_days,
+            'city': user_input.city,
+            'budget': target_daily_spend,
+            'preferences': preferences,
+            'hours': self.hours_per_day
+        })
+        
+        response = self.llama.query(
+            prompt, self.get_system_prompt(), max_tokens=MAX_TOKENS * num_days, model=self.cheap_model, json_mode=True
+        )
+        if not response:
+            return {}
+        
+        data = self.llama.extract_json(response)
+        if not isinstance(data, dict) or not isinstance(data.get('days'), list):
+            print("Warning: Could not parse full itinerary, planning days individually")
+            return {}
+        
+        itinerary = {}
+        for index, day_data in enumerate(data['days'], start=1):
+            if not isinstance(day_data, dict):
+                continue
+            try:
+                day_number = int(day_data.get('day', index))
+            except (TypeError, ValueError):
+                day_number = index
+            if 1 <= day_number <= num_days and day_number not in itinerary:
+                activities = self._parse_activities(day_data.get('activities') or [])
+                if activities:
+                    itinerary[day_number] = activities
+        
+        return itinerary
+    
+    def _parse_activities(self, items: list) -> list[Activity]:
+        """Build Activity objects from raw JSON, skipping malformed entries"""
+        if not isinstance(items, list):
+            return []
+        activities = []
+        for act_data in items:
+            try:
+                activities.append(Activity(
+                    name=act_data.get('name', 'Unknown Activity'),
+                    description=act_data.get('description', ''),
+                    duration_hours=float(act_data.get('duration_hours', 2.0)),
+                    cost=float(act_data.get('cost', 0.0)),
+                    activity_type=act_data.get('activity_type', 'sightseeing'),
+                    time_slot=act_data.get('time_slot', 'morning')
+                ))
+            except (AttributeError, KeyError, TypeError, ValueError) as e:
+                print(f"Warning: Could not parse activity: {e}")
+        return activities
     
     def generate_activities_for_day(
         self, 
         city: str, 
         day_number: int, 
         remaining_budget: float,
-        preferences: list[str],
-        previous_activities: list[str] = None
+        preferences: str,
+        previous_activities: str = ""
     ) -> list[Activity]:
-        """Generate activities for a single day using Llama"""
+        """Generate activities for a single day using Llama.
+        
+        preferences and previous_activities are comma-separated strings,
+        joined once per plan by the caller.
+        """
         
         previous_str = ""
         if previous_activities:
-            previous_str = f"\nAvoid repeating these activities: {', '.join(previous_activities)}"
+            previous_str = f"\nAvoid repeating these activities: {previous_activities}"
+        
+        # Bucket the budget so near-identical requests share a cached completion
+        budget_bucket = _bucket_budget(remaining_budget)
         
         # Calculate target daily spend
-        target_daily_spend = remaining_budget * self.budget_utilization_target / max(1, (self.hours_per_day // 3))
+        target_daily_spend = budget_bucket * self.budget_utilization_target / max(1, (self.hours_per_day // 3))
         if day_number == 1:
-            target_daily_spend = remaining_budget * self.budget_utilization_target / 3
-        
-        prompt = f"""Day {day_number} in {city}. Budget: ₹{target_daily_spend:.0f}. Preferences: {', '.join(preferences)}. {self.hours_per_day}h available.{previous_str}
-Generate 3-4 activities. Respond with JSON only: {{"activities": [{{"name": "string", "description": "short", "duration_hours": float, "cost": float, "activity_type": "string", "time_slot": "morning|afternoon|evening"}}]}}"""
-        
-        response = self.llama.query(prompt, self.get_system_prompt())
-        
-        if not response:
-            return self._get_fallback_activities(city, day_number, remaining_budget)
-        
-        # Parse the response
-        data = self.llama.extract_json(response)
+            target_daily_spend = budget_bucket * self.budget_utilization_target / 3
+        
+        prompt = DAY_PROMPT_TEMPLATE.format_map({
+            'day': day_number,
+            'city': city,
+            'budget': target_daily_spend,
+            'preferences': preferences,
+            'hours': self.hours_per_day,
+            'previous': previous_str
+        })
         
-        if not data or 'activities' not in data:
+        data = None
+        for model in dict.fromkeys((self.cheap_model, self.strong_model)):
+            response = self.llama.query(prompt, self.get_system_prompt(), model=model, json_mode=True)
+            data = self.llama.extract_json(response) if response else None
+            if isinstance(data, dict) and isinstance(data.get('activities'), list):
+                break
+        else:
             print(f"Warning: Could not parse activities for day {day_number}, using fallback")
             return self._get_fallback_activities(city, day_number, remaining_budget)
         
-        activities = []
-        for act_data in data['activities']:
-            try:
-                activity = Activity(
-                    name=act_data.get('name', 'Unknown Activity'),
-                    description=act_data.get('description', ''),
-                    duration_hours=float(act_data.get('duration_hours', 2.0)),
-                    cost=float(act_data.get('cost', 0.0)),
-                    activity_type=act_data.get('activity_type', 'sightseeing'),
-                    time_slot=act_data.get('time_slot', 'morning')
-                )
-                activities.append(activity)
-            except (KeyError, ValueError) as e:
-                print(f"Warning: Could not parse activity: {e}")
-                continue
-        
-        return activities
+        return self._parse_activities(data['activities'])
     
     def _get_fallback_activities(self, city: str, day_number: int, budget: float) -> list[Activity]:
         """Fallback activities if AI generation fails"""
-        daily_budget = budget * self.budget_utilization_target / 3
-        return [
-            Activity(
-                name=f"Premium {city} Guided Tour",
-                description=f"Expert-led tour of {city}'s top attractions with skip-the-line access",
-                duration_hours=3.0,
-                cost=daily_budget * 0.30,
-                activity_type="sightseeing",
-                time_slot="morning"
-            ),
-            Activity(
-                name=f"Fine Dining at Top {city} Restaurant",
-                description=f"Michelin-recommended restaurant experience with local specialties",
-                duration_hours=2.0,
-                cost=daily_budget * 0.25,
-                activity_type="food",
-                time_slot="afternoon"
-            ),
-            Activity(
-                name=f"{city} Cultural Experience & Show",
-                description=f"Traditional performance or cultural show unique to {city}",
-                duration_hours=2.5,
-                cost=daily_budget * 0.25,
-                activity_type="cultural",
-                time_slot="evening"
-            ),
-            Activity(
-                name=f"Exclusive {city} Night Tour",
-                description=f"Private evening tour showcasing {city}'s illuminated landmarks",
-                duration_hours=2.0,
-                cost=daily_budget * 0.20,
-                activity_type="nightlife",
-                time_slot="evening"
-            )
-        ]
+        # Bucketed so different trip budgets share the memoized fields
+        daily_budget = _bucket_budget(round(budget * self.budget_utilization_target / 3), FALLBACK_BUDGET_BUCKET)
+        # Fresh instances each call: plans track activities by identity
+        return [Activity(*fields) for fields in _fallback_activity_fields(city, daily_budget)]
     
     def validate_day_plan(self, day: DayPlan, daily_budget: float) -> tuple[bool, str]:
         """Validate a day plan against constraints."""
         if day.total_cost > daily_budget * 1.10:
-            return False, f"Day {day.day_number} exceeds budget: ${day.total_cost:.2f} > ${daily_budget:.2f}"
+            return False, f"Day {day.day_number} exceeds budget: ₹{day.total_cost:.0f} > ₹{daily_budget:.0f}"
         
         min_spend = daily_budget * self.min_daily_spend_ratio
         if day.total_cost < min_spend:
-            return False, f"Day {day.day_number} underspends: ${day.total_cost:.2f} < ${min_spend:.2f}"
+            return False, f"Day {day.day_number} underspends: ₹{day.total_cost:.0f} < ₹{min_spend:.0f}"
         
         if day.total_hours > self.hours_per_day:
             return False, f"Day {day.day_number} exceeds time limit: {day.total_hours:.1f}h > {self.hours_per_day}h"
@@ -288,23 +682,34 @@ Generate 3-4 activities. Respond with JSON only: {{"activities": [{{"name": "str
     
     def optimize_day_plan(self, day: DayPlan, daily_budget: float) -> DayPlan:
         """Optimize a day plan to fit within constraints"""
-        time_slot_order = {"morning": 0, "afternoon": 1, "evening": 2}
-        day.activities.sort(key=lambda x: time_slot_order.get(x.time_slot, 1))
-        
-        while day.total_cost > daily_budget and len(day.activities) > 2:
-            removable = [a for a in day.activities if a.cost > daily_budget * 0.3]
-            if removable:
-                to_remove = max(removable, key=lambda x: x.cost)
-                day.activities.remove(to_remove)
-                day.total_cost -= to_remove.cost
-                day.total_hours -= to_remove.duration_hours
-        
-        while day.total_hours > self.hours_per_day and len(day.activities) > 2:
-            longest = max(day.activities, key=lambda x: x.duration_hours)
-            day.activities.remove(longest)
-            day.total_cost -= longest.cost
-            day.total_hours -= longest.duration_hours
+        day.set_activities(sort_by_time_slot(day.activities))
+        activities = day.activities
+        total_cost = day.total_cost
+        total_hours = day.total_hours
+        kept = len(activities)
+        dropped = set()
+        
+        # Drop the priciest over-allocated activities until within budget
+        expensive = [a for a in activities if a.cost > daily_budget * 0.3]
+        for activity in sorted(expensive, key=lambda x: x.cost, reverse=True):
+            if total_cost <= daily_budget or kept <= 2:
+                break
+            dropped.add(id(activity))
+            total_cost -= activity.cost
+            total_hours -= activity.duration_hours
+            kept -= 1
+        
+        # Then drop the longest activities until within the time limit
+        survivors = [a for a in activities if id(a) not in dropped]
+        for activity in sorted(survivors, key=lambda x: x.duration_hours, reverse=True):
+            if total_hours <= self.hours_per_day or kept <= 2:
+                break
+            dropped.add(id(activity))
+            total_cost -= activity.cost
+            total_hours -= activity.duration_hours
+            kept -= 1
         
+        day.set_activities([a for a in activities if id(a) not in dropped])
         return day
     
     def replan_day(
@@ -313,63 +718,35 @@ Generate 3-4 activities. Respond with JSON only: {{"activities": [{{"name": "str
         day_number: int, 
         failed_plan: DayPlan,
         remaining_budget: float,
-        preferences: list[str],
+        preferences: str,
         error_message: str
     ) -> DayPlan:
         """Re-plan a day that failed validation"""
         print(f"  🔄 Re-planning day {day_number}: {error_message}")
         
-        prompt = f"""The previous plan for Day {day_number} in {city} failed validation.
-Error: {error_message}
-Previous plan cost: ${failed_plan.total_cost:.2f}
-Previous plan hours: {failed_plan.total_hours:.1f}h
-
-Create a NEW plan that:
-1. Stays strictly under ${remaining_budget:.2f} budget
-2. Uses maximum {self.hours_per_day} hours
-3. Includes 3-4 activities
-4. Matches preferences: {', '.join(preferences)}
-
-Respond ONLY with valid JSON:
-{{
-    "activities": [
-        {{
-            "name": "Activity Name",
-            "description": "Brief description",
-            "duration_hours": 2.0,
-            "cost": 30.0,
-            "activity_type": "sightseeing",
-            "time_slot": "morning"
-        }}
-    ]
-}}"""
-        
-        response = self.llama.query(prompt, self.get_system_prompt())
+        prompt = REPLAN_PROMPT_TEMPLATE.format_map({
+            'day': day_number,
+            'city': city,
+            'error': error_message,
+            'previous_cost': failed_plan.total_cost,
+            'previous_hours': failed_plan.total_hours,
+            'budget': remaining_budget,
+            'hours': self.hours_per_day,
+            'preferences': preferences
+        })
+        
+        response = self.llama.query(prompt, self.get_system_prompt(), model=self.strong_model, json_mode=True)
         
         if not response:
             return self.optimize_day_plan(failed_plan, remaining_budget)
         
         data = self.llama.extract_json(response)
         
-        if not data or 'activities' not in data:
+        if not isinstance(data, dict) or not isinstance(data.get('activities'), list):
             return self.optimize_day_plan(failed_plan, remaining_budget)
         
         new_day = DayPlan(day_number=day_number)
-        
-        for act_data in data['activities']:
-            try:
-                activity = Activity(
-                    name=act_data.get('name', 'Unknown Activity'),
-                    description=act_data.get('description', ''),
-                    duration_hours=float(act_data.get('duration_hours', 2.0)),
-                    cost=float(act_data.get('cost', 0.0)),
-                    activity_type=act_data.get('activity_type', 'sightseeing'),
-                    time_slot=act_data.get('time_slot', 'morning')
-                )
-                new_day.add_activity(activity)
-            except (KeyError, ValueError):
-                continue
-        
+        new_day.set_activities(self._parse_activities(data['activities']))
         return new_day
     
     def create_travel_plan(self, user_input: UserInput) -> TravelPlan:
@@ -380,7 +757,9 @@ Respond ONLY with valid JSON:
         print(f"📍 City: {user_input.city}")
         print(f"💰 Budget: ₹{user_input.budget:.0f}")
         print(f"📅 Days: {user_input.num_days}")
-        print(f"🎯 Preferences: {', '.join(user_input.activity_preferences)}")
+        # Joined once here and reused by every prompt for this plan
+        preferences_str = ', '.join(user_input.activity_preferences)
+        print(f"🎯 Preferences: {preferences_str}")
         print(f"{'='*60}\n")
         
         travel_plan = TravelPlan(
@@ -390,54 +769,103 @@ Respond ONLY with valid JSON:
             preferences=user_input.activity_preferences
         )
         
-        remaining_budget = user_input.budget
         daily_budget_target = user_input.budget / user_input.num_days
-        all_previous_activities = []
+        day_numbers = range(1, user_input.num_days + 1)
         
-        for day_num in range(1, user_input.num_days + 1):
-            print(f"📅 Planning Day {day_num}...")
-            print(f"   Budget remaining: ₹{remaining_budget:.0f}")
+        def estimated_remaining(day_num: int) -> float:
+            """Budget left before a day, assuming earlier days hit their target"""
+            return user_input.budget - daily_budget_target * (day_num - 1)
+        
+        day_plans = {}
+        errors = {}
+        replan_attempts = {}
+        seen_names = set()
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(user_input.num_days, self.max_concurrent_calls))) as pool:
+            pending = {}
+            
+            def check(day_num: int):
+                """CHECK a day and, if it fails, start its replan right away"""
+                is_valid, error_message = self.validate_day_plan(day_plans[day_num], daily_budget_target)
+                if is_valid:
+                    errors.pop(day_num, None)
+                    return
+                errors[day_num] = error_message
+                if replan_attempts.get(day_num, 0) < self.max_replanning_attempts:
+                    replan_attempts[day_num] = replan_attempts.get(day_num, 0) + 1
+                    future = pool.submit(
+                        self.replan_day,
+                        city=user_input.city,
+                        day_number=day_num,
+                        failed_plan=day_plans[day_num],
+                        remaining_budget=min(estimated_remaining(day_num), daily_budget_target * 1.2),
+                        preferences=preferences_str,
+                        error_message=error_message
+                    )
+                    pending[future] = (day_num, 'replan')
+            
+            def accept(day_num: int, activities: list[Activity]):
+                """Build a day from generated activities, dropping repeats"""
+                fresh = [a for a in activities if a.name.strip().lower() not in seen_names]
+                # Keep repeats (e.g. fallback activities) rather than leave a day empty
+                chosen = fresh if len(fresh) >= 2 else activities
+                day_plan = DayPlan(day_number=day_num)
+                for activity in chosen:
+                    seen_names.add(activity.name.strip().lower())
+                    day_plan.add_activity(activity)
+                day_plans[day_num] = day_plan
+                check(day_num)
+            
+            # PLAN - request the whole itinerary in one call
+            print(f"📅 Planning {user_input.num_days} days...")
             print(f"   Target daily budget: ₹{daily_budget_target:.0f}")
             
-            activities = self.generate_activities_for_day(
-                city=user_input.city,
-                day_number=day_num,
-                remaining_budget=remaining_budget,
-                preferences=user_input.activity_preferences,
-                previous_activities=all_previous_activities
-            )
+            generated = self.generate_full_itinerary(user_input, daily_budget_target, preferences_str)
             
-            day_plan = DayPlan(day_number=day_num)
-            for activity in activities:
-                day_plan.add_activity(activity)
+            # Backfill any days the batched call missed, concurrently
+            missing = [day_num for day_num in day_numbers if day_num not in generated]
+            if missing:
+                # Only the most recent names are sent so the prompt stays a fixed size
+                recent_activities = ', '.join(deque(
+                    (activity.name for activities in generated.values() for activity in activities),
+                    maxlen=self.max_previous_activities
+                ))
+                for day_num in missing:
+                    future = pool.submit(
+                        self.generate_activities_for_day,
+                        city=user_input.city,
+                        day_number=day_num,
+                        remaining_budget=estimated_remaining(day_num),
+                        preferences=preferences_str,
+                        previous_activities=recent_activities
+                    )
+                    pending[future] = (day_num, 'generate')
             
-            is_valid, error_message = self.validate_day_plan(day_plan, daily_budget_target)
+            # Replans of the batched days overlap with the backfill calls
+            for day_num in sorted(generated):
+                accept(day_num, generated[day_num])
             
-            replan_attempts = 0
-            while not is_valid and replan_attempts < self.max_replanning_attempts:
-                replan_attempts += 1
-                day_plan = self.replan_day(
-                    city=user_input.city,
-                    day_number=day_num,
-                    failed_plan=day_plan,
-                    remaining_budget=min(remaining_budget, daily_budget_target * 1.2),
-                    preferences=user_input.activity_preferences,
-                    error_message=error_message
-                )
-                is_valid, error_message = self.validate_day_plan(day_plan, daily_budget_target)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    day_num, kind = pending.pop(future)
+                    if kind == 'generate':
+                        accept(day_num, future.result())
+                    else:
+                        day_plans[day_num] = future.result()
+                        check(day_num)
+        
+        for day_num in day_numbers:
+            day_plan = day_plans[day_num]
             
-            if not is_valid:
+            if day_num in errors:
                 print(f"   ⚠️ Applying final optimization for day {day_num}")
                 day_plan = self.optimize_day_plan(day_plan, daily_budget_target)
             
-            travel_plan.days.append(day_plan)
-            remaining_budget -= day_plan.total_cost
-            all_previous_activities.extend([a.name for a in day_plan.activities])
+            travel_plan.add_day(day_plan)
             
             print(f"   ✅ Day {day_num} planned: {len(day_plan.activities)} activities, ₹{day_plan.total_cost:.0f}")
         
-        travel_plan.calculate_total_cost()
-        
         if travel_plan.total_cost > user_input.budget:
             print(f"\n⚠️ Total cost ₹{travel_plan.total_cost:.0f} exceeds budget ₹{user_input.budget:.0f}")
             print("🔄 Applying global optimization...")
@@ -445,24 +873,50 @@ Respond ONLY with valid JSON:
         
         return travel_plan
     
+    def create_fallback_plan(self, user_input: UserInput) -> TravelPlan:
+        """Build a plan from fallback activities without calling the LLM"""
+        travel_plan = TravelPlan(
+            city=user_input.city,
+            budget=user_input.budget,
+            num_days=user_input.num_days,
+            preferences=user_input.activity_preferences
+        )
+        
+        # _get_fallback_activities spreads its budget over three days, so hand
+        # it three days' worth to get each day's full share
+        fallback_budget = user_input.budget * 3 / user_input.num_days
+        for day_num in range(1, user_input.num_days + 1):
+            day_plan = DayPlan(day_number=day_num)
+            for activity in self._get_fallback_activities(user_input.city, day_num, fallback_budget):
+                day_plan.add_activity(activity)
+            travel_plan.add_day(day_plan)
+        
+        return travel_plan
+    
     def _global_budget_optimization(self, plan: TravelPlan, budget: float) -> TravelPlan:
         """Optimize the entire plan to fit within the global budget"""
-        all_activities = []
-        for day in plan.days:
-            for activity in day.activities:
-                all_activities.append((day, activity))
+        if plan.total_cost <= budget:
+            return plan
         
+        all_activities = [(day, activity) for day in plan.days for activity in day.activities]
         all_activities.sort(key=lambda x: x[1].cost, reverse=True)
         
+        kept = {id(day): len(day.activities) for day in plan.days}
+        dropped = set()
+        
         for day, activity in all_activities:
             if plan.total_cost <= budget:
                 break
-            if len(day.activities) > 2:
-                day.activities.remove(activity)
-                day.total_cost -= activity.cost
-                day.total_hours -= activity.duration_hours
+            if kept[id(day)] > 2:
+                kept[id(day)] -= 1
+                dropped.add(id(activity))
                 plan.total_cost -= activity.cost
         
+        # Apply the removals in one pass per day
+        if dropped:
+            for day in plan.days:
+                day.set_activities([a for a in day.activities if id(a) not in dropped])
+        
         return plan
     
     def generate_itinerary_summary(self, plan: TravelPlan) -> str:
@@ -35,11 +35,20 @@ def create_app():
     from api.routes.travel import travel_bp
     app.register_blueprint(travel_bp)
     
+    # Outside debug mode the page is compiled once at startup instead of
+    # being looked up (and checked for changes) on every request
+    index_template = None
+    if not app.debug:
+        app.config['TEMPLATES_AUTO_RELOAD'] = False
+        index_template = app.jinja_env.get_template('index.html')
+    
     # Home route
     @app.route('/')
     def index():
         """Render the main page"""
-        return render_template('index.html')
+        if index_template is None:
+            return render_template('index.html')
+        return index_template.render()
     
     return app
 
@@ -4,25 +4,49 @@ Travel Routes
 API routes for travel planning functionality.
 """
 
-from flask import Blueprint, request, jsonify, make_response
+from flask import Blueprint, send_file
+import io
 import sys
 import os
+import threading
 
 # Add parent directories to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from agents.travel_planner import TravelPlannerAgent, UserInput
-from api.utils.cost_calculator import estimate_travel_cost, calculate_hotel_cost, get_activity_emoji
-from api.utils.pdf_generator import generate_pdf
+from agents.travel_planner import TravelPlannerAgent, UserInput, get_redis_client, sort_by_time_slot
+from api.utils.cost_calculator import calculate_hotel_cost, estimate_travel_cost
+from api.utils.pdf_cache import PdfCache
+from api.utils.serialization import activity_to_dict, json_body, json_response
+from config.settings import PDF_CACHE_SIZE, PDF_CACHE_TTL
 
 travel_bp = Blueprint('travel', __name__)
 
+# Shared across requests so the OpenRouter connection pool is reused. Built on
+# the first /plan call so the app still starts without an API key configured.
+_AGENT = None
+_AGENT_LOCK = threading.Lock()
+
+# Rendered PDFs keyed by plan content hash, shared with other workers via Redis
+_PDF_CACHE = PdfCache(PDF_CACHE_SIZE, redis_client=get_redis_client(), ttl=PDF_CACHE_TTL)
+
+
+def get_agent() -> TravelPlannerAgent:
+    """Return the shared planner agent, building it on first use"""
+    global _AGENT
+    if _AGENT is None:
+        with _AGENT_LOCK:
+            if _AGENT is None:
+                _AGENT = TravelPlannerAgent()
+    return _AGENT
+
 
 @travel_bp.route('/plan', methods=['POST'])
 def create_plan():
     """Create a travel plan based on user input"""
     try:
-        data = request.get_json()
+        data = json_body()
+        if not isinstance(data, dict):
+            return json_response({'success': False, 'error': 'Request body must be a JSON object'}, 400)
         
         # Extract inputs
         budget = float(data.get('budget', 1000))
@@ -30,6 +54,12 @@ def create_plan():
         city = data.get('city', 'Paris')
         preferences = data.get('preferences', ['sightseeing', 'food', 'cultural'])
         
+        # Reject unusable input before doing any cost math or LLM calls
+        if budget <= 0:
+            return json_response({'success': False, 'error': 'Budget must be greater than zero'}, 400)
+        if not 1 <= num_days <= 30:
+            return json_response({'success': False, 'error': 'Days must be between 1 and 30'}, 400)
+        
         # Travelers
         adults = int(data.get('adults', 2))
         children = int(data.get('children', 0))
@@ -89,8 +119,13 @@ def create_plan():
             activity_preferences=preferences
         )
         
-        agent = TravelPlannerAgent()
-        travel_plan = agent.create_travel_plan(user_input)
+        # Fixed costs already exceed the budget: skip the LLM and return a
+        # scaffold of basic activities alongside the warning
+        agent = get_agent()
+        if budget_exceeded:
+            travel_plan = agent.create_fallback_plan(user_input)
+        else:
+            travel_plan = agent.create_travel_plan(user_input)
         summary = agent.generate_itinerary_summary(travel_plan)
         
         # Calculate grand total
@@ -123,57 +158,46 @@ def create_plan():
             'budget_warning': budget_warning,
             'budget_exceeded': budget_exceeded,
             'summary': summary if summary else "Enjoy your amazing trip!",
-            'days': []
-        }
-        
-        for day in travel_plan.days:
-            day_data = {
-                'day_number': day.day_number,
-                'total_cost': day.total_cost,
-                'total_hours': day.total_hours,
-                'activities': []
-            }
-            
-            time_order = {"morning": 0, "afternoon": 1, "evening": 2}
-            sorted_activities = sorted(day.activities, key=lambda x: time_order.get(x.time_slot, 1))
-            
-            for activity in sorted_activities:
-                activity_data = {
-                    'name': activity.name,
-                    'description': activity.description,
-                    'duration_hours': activity.duration_hours,
-                    'cost': activity.cost,
-                    'activity_type': activity.activity_type,
-                    'time_slot': activity.time_slot,
-                    'emoji': get_activity_emoji(activity.activity_type)
+            'days': [
+                {
+                    'day_number': day.day_number,
+                    'total_cost': day.total_cost,
+                    'total_hours': day.total_hours,
+                    'activities': [
+                        activity_to_dict(activity)
+                        for activity in sort_by_time_slot(day.activities)
+                    ]
                 }
-                day_data['activities'].append(activity_data)
-            
-            plan_data['days'].append(day_data)
+                for day in travel_plan.days
+            ]
+        }
         
-        return jsonify({'success': True, 'plan': plan_data})
+        return json_response({'success': True, 'plan': plan_data})
         
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return json_response({'success': False, 'error': str(e)}, 500)
 
 
 @travel_bp.route('/download-pdf', methods=['POST'])
 def download_pdf():
     """Generate and download PDF of the travel itinerary"""
     try:
-        data = request.get_json()
+        data = json_body()
+        if not isinstance(data, dict):
+            return json_response({'success': False, 'error': 'Request body must be a JSON object'}, 400)
         plan = data.get('plan')
         
         if not plan:
-            return jsonify({'success': False, 'error': 'No plan data provided'}), 400
+            return json_response({'success': False, 'error': 'No plan data provided'}, 400)
         
-        pdf_buffer = generate_pdf(plan)
+        pdf_buffer = io.BytesIO(_PDF_CACHE.render(plan))
         
-        response = make_response(pdf_buffer.getvalue())
-        response.headers['Content-Type'] = 'application/pdf'
-        response.headers['Content-Disposition'] = f'attachment; filename=Travel_Itinerary_{plan["city"]}_{plan["num_days"]}days.pdf'
-        
-        return response
+        return send_file(
+            pdf_buffer,
+            mimetype='application/pdf',
+            as_attachment=True,
+            download_name=f'Travel_Itinerary_{plan["city"]}_{plan["num_days"]}days.pdf'
+        )
         
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return json_response({'success': False, 'error': str(e)}, 500)
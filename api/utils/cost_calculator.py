@@ -4,52 +4,110 @@ Cost Calculator Utilities
 Functions to estimate travel and hotel costs.
 """
 
+import re
+from functools import lru_cache
+
+
+# Common Indian city pairs with approximate distances (in km)
+CITY_DISTANCES = {
+    ('mumbai', 'delhi'): 1400,
+    ('mumbai', 'bangalore'): 980,
+    ('mumbai', 'chennai'): 1330,
+    ('mumbai', 'kolkata'): 1870,
+    ('mumbai', 'hyderabad'): 710,
+    ('mumbai', 'pune'): 150,
+    ('mumbai', 'goa'): 590,
+    ('mumbai', 'jaipur'): 1150,
+    ('delhi', 'bangalore'): 2150,
+    ('delhi', 'chennai'): 2180,
+    ('delhi', 'kolkata'): 1530,
+    ('delhi', 'hyderabad'): 1550,
+    ('delhi', 'jaipur'): 280,
+    ('delhi', 'agra'): 230,
+    ('delhi', 'manali'): 530,
+    ('delhi', 'shimla'): 350,
+    ('bangalore', 'chennai'): 350,
+    ('bangalore', 'hyderabad'): 570,
+    ('bangalore', 'goa'): 560,
+    ('bangalore', 'mysore'): 150,
+    ('kolkata', 'chennai'): 1670,
+    ('chennai', 'hyderabad'): 630,
+}
+
+# Alternate and historical names mapped to the names used above
+CITY_ALIASES = {
+    'bombay': 'mumbai',
+    'bengaluru': 'bangalore',
+    'madras': 'chennai',
+    'calcutta': 'kolkata',
+    'mysuru': 'mysore',
+}
+
+# Direction-independent lookup: frozenset({city1, city2}) -> distance
+_ROUTE_DISTANCES = {frozenset(pair): dist for pair, dist in CITY_DISTANCES.items()}
+
+# Every recognised name (canonical or alias) -> canonical name
+_CITY_NAMES = {city: city for pair in CITY_DISTANCES for city in pair}
+_CITY_NAMES.update(CITY_ALIASES)
+
+# One alternation over all names, longest first, so a single scan finds
+# the city inside free-form input such as "new delhi" or "goa, india"
+_CITY_NAME_RE = re.compile('|'.join(sorted(map(re.escape, _CITY_NAMES), key=len, reverse=True)))
+
+
+@lru_cache(maxsize=1024)
+def _canonical_city(name: str) -> str:
+    """Map a normalized city name to its canonical form, e.g. 'new delhi' -> 'delhi'"""
+    canonical = _CITY_NAMES.get(name)
+    if canonical is not None:
+        return canonical
+    match = _CITY_NAME_RE.search(name)
+    return _CITY_NAMES[match.group()] if match else name
+
+
+# Base prices per night in INR based on star rating
+HOTEL_BASE_PRICES = {
+    2: 800,   # Budget
+    3: 1500,  # Standard
+    4: 3500,  # Premium
+    5: 8000   # Luxury
+}
+AC_PREMIUM = 1.3  # 30% more for AC
+
+# City tiers for hotel pricing
+EXPENSIVE_CITIES = frozenset({'mumbai', 'delhi', 'bangalore', 'goa', 'chennai', 'hyderabad'})
+MODERATE_CITIES = frozenset({'pune', 'jaipur', 'kolkata', 'ahmedabad'})
+
+# Substring fallback for inputs like "north goa" or "new delhi"
+_EXPENSIVE_CITY_RE = re.compile('|'.join(sorted(EXPENSIVE_CITIES)))
+_MODERATE_CITY_RE = re.compile('|'.join(sorted(MODERATE_CITIES)))
+
+ACTIVITY_EMOJIS = {
+    "sightseeing": "🏛️",
+    "adventure": "🎢",
+    "cultural": "🎭",
+    "food": "🍽️",
+    "relaxation": "🧘",
+    "shopping": "🛍️",
+    "nightlife": "🌙"
+}
+DEFAULT_ACTIVITY_EMOJI = "📍"
+
 
 def estimate_travel_cost(origin: str, destination: str) -> float:
     """
     Estimate travel cost based on origin and destination cities in India.
     Uses approximate pricing for train/bus travel.
     """
-    # Common Indian city pairs with approximate distances (in km)
-    city_distances = {
-        ('mumbai', 'delhi'): 1400,
-        ('mumbai', 'bangalore'): 980,
-        ('mumbai', 'chennai'): 1330,
-        ('mumbai', 'kolkata'): 1870,
-        ('mumbai', 'hyderabad'): 710,
-        ('mumbai', 'pune'): 150,
-        ('mumbai', 'goa'): 590,
-        ('mumbai', 'jaipur'): 1150,
-        ('delhi', 'bangalore'): 2150,
-        ('delhi', 'chennai'): 2180,
-        ('delhi', 'kolkata'): 1530,
-        ('delhi', 'hyderabad'): 1550,
-        ('delhi', 'jaipur'): 280,
-        ('delhi', 'agra'): 230,
-        ('delhi', 'manali'): 530,
-        ('delhi', 'shimla'): 350,
-        ('bangalore', 'chennai'): 350,
-        ('bangalore', 'hyderabad'): 570,
-        ('bangalore', 'goa'): 560,
-        ('bangalore', 'mysore'): 150,
-        ('kolkata', 'chennai'): 1670,
-        ('chennai', 'hyderabad'): 630,
-    }
-    
-    origin_lower = origin.lower().strip()
-    dest_lower = destination.lower().strip()
-    
+    return _estimate_travel_cost(origin.lower().strip(), destination.lower().strip())
+
+
+@lru_cache(maxsize=4096)
+def _estimate_travel_cost(origin_lower: str, dest_lower: str) -> float:
+    """Cached travel cost lookup on normalized city names"""
     # Check if we have this route
-    distance = None
-    for (city1, city2), dist in city_distances.items():
-        if (city1 in origin_lower or origin_lower in city1) and \
-           (city2 in dest_lower or dest_lower in city2):
-            distance = dist
-            break
-        if (city2 in origin_lower or origin_lower in city2) and \
-           (city1 in dest_lower or dest_lower in city1):
-            distance = dist
-            break
+    route = frozenset((_canonical_city(origin_lower), _canonical_city(dest_lower)))
+    distance = _ROUTE_DISTANCES.get(route)
     
     # If no known route, estimate based on assumption
     if distance is None:
@@ -71,28 +129,22 @@ def calculate_hotel_cost(rating: int, room_type: str, num_days: int, city: str)
     """
     Calculate estimated hotel cost based on rating, room type, and city.
     """
-    # Base prices per night in INR based on star rating
-    base_prices = {
-        2: 800,   # Budget
-        3: 1500,  # Standard
-        4: 3500,  # Premium
-        5: 8000   # Luxury
-    }
-    
-    base_price = base_prices.get(rating, 1500)
+    return _calculate_hotel_cost(rating, room_type, num_days, city.lower())
+
+
+@lru_cache(maxsize=4096)
+def _calculate_hotel_cost(rating: int, room_type: str, num_days: int, city_lower: str) -> float:
+    """Cached hotel cost calculation on a normalized city name"""
+    base_price = HOTEL_BASE_PRICES.get(rating, 1500)
     
     # AC premium (30% more for AC)
     if room_type == 'ac':
-        base_price *= 1.3
+        base_price *= AC_PREMIUM
     
     # City-based multiplier
-    expensive_cities = ['mumbai', 'delhi', 'bangalore', 'goa', 'chennai', 'hyderabad']
-    moderate_cities = ['pune', 'jaipur', 'kolkata', 'ahmedabad']
-    
-    city_lower = city.lower()
-    if any(c in city_lower for c in expensive_cities):
+    if city_lower in EXPENSIVE_CITIES or _EXPENSIVE_CITY_RE.search(city_lower):
         base_price *= 1.4
-    elif any(c in city_lower for c in moderate_cities):
+    elif city_lower in MODERATE_CITIES or _MODERATE_CITY_RE.search(city_lower):
         base_price *= 1.2
     
     # Calculate total for all nights
@@ -103,13 +155,4 @@ def calculate_hotel_cost(rating: int, room_type: str, num_days: int, city: str)
 
 def get_activity_emoji(activity_type: str) -> str:
     """Get emoji for activity type"""
-    emoji_map = {
-        "sightseeing": "🏛️",
-        "adventure": "🎢",
-        "cultural": "🎭",
-        "food": "🍽️",
-        "relaxation": "🧘",
-        "shopping": "🛍️",
-        "nightlife": "🌙"
-    }
-    return emoji_map.get(activity_type, "📍")
+    return ACTIVITY_EMOJIS.get(activity_type, DEFAULT_ACTIVITY_EMOJI)
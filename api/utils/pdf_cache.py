@@ -0,0 +1,67 @@
+"""
+PDF Cache
+==========
+Rendered itinerary PDFs keyed by plan content, optionally backed by Redis.
+"""
+
+from collections import OrderedDict
+import hashlib
+import json
+import threading
+
+
+class PdfCache:
+    """Thread-safe in-memory LRU of rendered PDFs, optionally backed by Redis.
+
+    A cached PDF is returned byte-for-byte, so its footer timestamp is the
+    time the plan was first rendered, not the time of the download.
+    """
+
+    REDIS_PREFIX = b"travelcraft:pdf:"
+
+    def __init__(self, maxsize: int, redis_client=None, ttl: int = 3600):
+        self.maxsize = maxsize
+        self.redis = redis_client
+        self.ttl = ttl
+        self._data: "OrderedDict[bytes, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(plan: dict) -> bytes:
+        return hashlib.blake2b(
+            json.dumps(plan, sort_keys=True, default=str).encode('utf-8'), digest_size=16
+        ).digest()
+
+    def render(self, plan: dict) -> bytes:
+        """Render a plan to PDF bytes, reusing the result for identical plans"""
+        key = self._key(plan)
+
+        with self._lock:
+            pdf_bytes = self._data.get(key)
+            if pdf_bytes is not None:
+                self._data.move_to_end(key)
+                return pdf_bytes
+
+        if self.redis is not None:
+            try:
+                pdf_bytes = self.redis.get(self.REDIS_PREFIX + key)
+            except Exception as e:
+                print(f"⚠️ Redis PDF cache read failed: {e}")
+
+        if pdf_bytes is None:
+            # ReportLab is heavy to import; load it on the first PDF request only
+            from api.utils.pdf_generator import generate_pdf
+            pdf_bytes = generate_pdf(plan).getvalue()
+            if self.redis is not None:
+                try:
+                    self.redis.setex(self.REDIS_PREFIX + key, self.ttl, pdf_bytes)
+                except Exception as e:
+                    print(f"⚠️ Redis PDF cache write failed: {e}")
+
+        with self._lock:
+            self._data[key] = pdf_bytes
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+        return pdf_bytes
@@ -6,6 +6,7 @@ Generates beautiful PDF itineraries for travel plans.
 
 import io
 from datetime import datetime
+from xml.sax.saxutils import escape
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -14,6 +15,187 @@ from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, Tabl
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 
 
+# Palette, parsed once
+_COLOR_DARK = colors.HexColor('#2C4A52')
+_COLOR_MEDIUM = colors.HexColor('#537A82')
+_COLOR_ACCENT = colors.HexColor('#C17F59')
+_COLOR_LIGHT_BG = colors.HexColor('#f8f9fa')
+_COLOR_GRID = colors.HexColor('#dee2e6')
+_COLOR_GREEN = colors.HexColor('#28a745')
+_COLOR_GREEN_BG = colors.HexColor('#d4edda')
+_COLOR_MUTED = colors.HexColor('#6c757d')
+_COLOR_HEADER_BG = colors.HexColor('#e9ecef')
+_COLOR_TEXT = colors.HexColor('#495057')
+
+# Styles are identical for every PDF, so they are built once at import
+_STYLES = getSampleStyleSheet()
+
+_TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=_STYLES['Heading1'],
+    fontSize=32,
+    spaceAfter=10,
+    alignment=TA_CENTER,
+    textColor=_COLOR_DARK,
+    fontName='Helvetica-Bold'
+)
+
+_SUBTITLE_STYLE = ParagraphStyle(
+    'CustomSubtitle',
+    parent=_STYLES['Normal'],
+    fontSize=16,
+    spaceAfter=30,
+    alignment=TA_CENTER,
+    textColor=_COLOR_MEDIUM,
+    fontName='Helvetica'
+)
+
+_HEADING_STYLE = ParagraphStyle(
+    'CustomHeading',
+    parent=_STYLES['Heading2'],
+    fontSize=18,
+    spaceBefore=25,
+    spaceAfter=12,
+    textColor=_COLOR_DARK,
+    fontName='Helvetica-Bold'
+)
+
+_SUMMARY_BOX_STYLE = ParagraphStyle(
+    'SummaryBox',
+    parent=_STYLES['Normal'],
+    fontSize=11,
+    fontName='Helvetica-Oblique',
+    textColor=_COLOR_TEXT,
+    leftIndent=20,
+    rightIndent=20,
+    spaceBefore=10,
+    spaceAfter=10,
+    leading=16
+)
+
+_FOOTER_STYLE = ParagraphStyle(
+    'Footer',
+    parent=_STYLES['Normal'],
+    fontSize=9,
+    alignment=TA_CENTER,
+    textColor=_COLOR_MUTED,
+    fontName='Helvetica'
+)
+
+_ACTIVITY_NAME_STYLE = ParagraphStyle(
+    'ActivityName',
+    parent=_STYLES['Normal'],
+    fontName='Helvetica-Bold'
+)
+
+_ACTIVITY_DESC_STYLE = ParagraphStyle(
+    'ActivityDescription',
+    parent=_STYLES['Normal'],
+    fontSize=9,
+    textColor=_COLOR_MUTED
+)
+
+_OVERVIEW_TABLE_STYLE = TableStyle([
+    # Header row
+    ('BACKGROUND', (0, 0), (-1, 0), _COLOR_DARK),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 14),
+    ('SPAN', (0, 0), (-1, 0)),
+    ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 15),
+    ('TOPPADDING', (0, 0), (-1, 0), 15),
+    # Label column
+    ('BACKGROUND', (0, 1), (0, -1), _COLOR_LIGHT_BG),
+    ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 1), (-1, -1), 11),
+    # Grid
+    ('GRID', (0, 0), (-1, -1), 1, _COLOR_GRID),
+    ('PADDING', (0, 0), (-1, -1), 12),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    # Alternating row colors
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, _COLOR_LIGHT_BG]),
+])
+
+_DAY_HEADER_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, -1), _COLOR_MEDIUM),
+    ('TEXTCOLOR', (0, 0), (-1, -1), colors.white),
+    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (0, 0), 14),
+    ('FONTSIZE', (1, 0), (1, 0), 12),
+    ('ALIGN', (0, 0), (0, 0), 'LEFT'),
+    ('ALIGN', (1, 0), (1, 0), 'RIGHT'),
+    ('PADDING', (0, 0), (-1, -1), 12),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('ROUNDEDCORNERS', [5, 5, 0, 0]),
+])
+
+_ACTIVITY_TABLE_STYLE = TableStyle([
+    # Header
+    ('BACKGROUND', (0, 0), (-1, 0), _COLOR_HEADER_BG),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 10),
+    ('TEXTCOLOR', (0, 0), (-1, 0), _COLOR_TEXT),
+    # Body
+    ('FONTSIZE', (0, 1), (-1, -1), 10),
+    ('GRID', (0, 0), (-1, -1), 0.5, _COLOR_GRID),
+    ('PADDING', (0, 0), (-1, -1), 10),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('ALIGN', (2, 0), (2, -1), 'CENTER'),
+    ('ALIGN', (3, 0), (3, -1), 'RIGHT'),
+    # Alternating rows
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, _COLOR_LIGHT_BG]),
+])
+
+_COST_TABLE_STYLE = TableStyle([
+    # Header
+    ('BACKGROUND', (0, 0), (-1, 0), _COLOR_GREEN),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 11),
+    # Totals section
+    ('FONTNAME', (0, -3), (-1, -1), 'Helvetica-Bold'),
+    ('BACKGROUND', (0, -3), (-1, -1), _COLOR_GREEN_BG),
+    ('FONTSIZE', (0, -3), (-1, -1), 11),
+    # Grid
+    ('GRID', (0, 0), (-1, -1), 0.5, _COLOR_GRID),
+    ('PADDING', (0, 0), (-1, -1), 10),
+    ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
+    # Alternating rows
+    ('ROWBACKGROUNDS', (0, 1), (-1, -4), [colors.white, _COLOR_LIGHT_BG]),
+])
+
+# Footer text; Paragraphs are built per document since ReportLab stores
+# layout state on them during build(). The timestamp records when the PDF
+# was first generated; cached copies keep it.
+_FOOTER_GENERATED = "Generated by AI Travel Planner | {:%B %d, %Y at %I:%M %p}"
+_FOOTER_POWERED_BY = "Powered by DeepSeek AI"
+
+
+_ACTIVITY_HEADER_ROW = ('Time', 'Activity', 'Hours', 'Cost')
+_MAX_DESCRIPTION_LENGTH = 60
+
+
+def _activity_row(activity: dict) -> list:
+    """Table row for one activity.
+    
+    Name and description use dedicated styles instead of inline <b>/<font>
+    markup, so ReportLab only parses the escaped model text.
+    """
+    desc = activity.get('description', '')
+    if len(desc) > _MAX_DESCRIPTION_LENGTH:
+        desc = f"{desc[:_MAX_DESCRIPTION_LENGTH]}..."
+    return [
+        activity.get('time_slot', 'morning').capitalize(),
+        [
+            Paragraph(escape(activity.get('name', 'Activity')), _ACTIVITY_NAME_STYLE),
+            Paragraph(escape(desc), _ACTIVITY_DESC_STYLE),
+        ],
+        f"{activity.get('duration_hours', 0)}h",
+        format_currency(activity.get('cost', 0)),
+    ]
+
+
 def format_currency(amount):
     """Format currency with Rs. prefix (PDF-safe)"""
     return f"Rs. {amount:,.0f}"
@@ -33,61 +215,19 @@ def generate_pdf(plan: dict) -> io.BytesIO:
         bottomMargin=2*cm
     )
     
-    # Styles
-    styles = getSampleStyleSheet()
-    
-    # Custom styles
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=32,
-        spaceAfter=10,
-        alignment=TA_CENTER,
-        textColor=colors.HexColor('#2C4A52'),
-        fontName='Helvetica-Bold'
-    )
-    
-    subtitle_style = ParagraphStyle(
-        'CustomSubtitle',
-        parent=styles['Normal'],
-        fontSize=16,
-        spaceAfter=30,
-        alignment=TA_CENTER,
-        textColor=colors.HexColor('#537A82'),
-        fontName='Helvetica'
-    )
-    
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading2'],
-        fontSize=18,
-        spaceBefore=25,
-        spaceAfter=12,
-        textColor=colors.HexColor('#2C4A52'),
-        fontName='Helvetica-Bold'
-    )
-    
-    normal_style = ParagraphStyle(
-        'CustomNormal',
-        parent=styles['Normal'],
-        fontSize=11,
-        spaceAfter=8,
-        fontName='Helvetica'
-    )
-    
     # Build PDF content
     elements = []
     
     # ========== TITLE SECTION ==========
     elements.append(Spacer(1, 20))
-    elements.append(Paragraph("TRAVEL ITINERARY", title_style))
+    elements.append(Paragraph("TRAVEL ITINERARY", _TITLE_STYLE))
     
     city_name = plan.get('city', 'Unknown').upper()
     num_days = plan.get('num_days', 0)
-    elements.append(Paragraph(f"{city_name} - {num_days} Days Adventure", subtitle_style))
+    elements.append(Paragraph(f"{city_name} - {num_days} Days Adventure", _SUBTITLE_STYLE))
     
     # Decorative line
-    elements.append(HRFlowable(width="60%", thickness=3, color=colors.HexColor('#C17F59'), 
+    elements.append(HRFlowable(width="60%", thickness=3, color=_COLOR_ACCENT, 
                                spaceAfter=20, hAlign='CENTER'))
     elements.append(Spacer(1, 10))
     
@@ -99,53 +239,34 @@ def generate_pdf(plan: dict) -> io.BytesIO:
     grand_total = total_cost + travel_cost + hotel_cost
     remaining = budget - grand_total
     utilization = plan.get('utilization', 0)
-    
-    overview_data = [
-        ['TRIP OVERVIEW', ''],
-        ['Destination', city_name],
-        ['Duration', f"{num_days} Days"],
-        ['Travelers', f"{plan.get('adults', 2)} Adults, {plan.get('children', 0)} Children"],
-        ['Budget', format_currency(budget)],
-        ['Activities Cost', format_currency(total_cost)],
-    ]
-    
-    # Add travel cost if present
-    if travel_cost > 0:
-        overview_data.append(['Travel Cost', format_currency(travel_cost)])
-    
-    # Add hotel cost if present
-    if hotel_cost > 0:
-        overview_data.append(['Hotel Cost', format_currency(hotel_cost)])
-    
-    overview_data.extend([
-        ['Grand Total', format_currency(grand_total)],
-        ['Remaining', format_currency(remaining)],
-        ['Budget Utilization', f"{utilization}%"],
-        ['Preferences', ', '.join(plan.get('preferences', [])).title()]
-    ])
+    days = plan.get('days', [])
+    
+    # Amounts shown in more than one table are formatted once
+    budget_text = format_currency(budget)
+    grand_total_text = format_currency(grand_total)
+    remaining_text = format_currency(remaining)
+    travel_cost_text = format_currency(travel_cost)
+    hotel_cost_text = format_currency(hotel_cost)
+    day_cost_texts = [format_currency(day.get('total_cost', 0)) for day in days]
+    
+    # Travel and hotel rows only appear when those costs are part of the plan
+    overview_data = [row for row in (
+        ('TRIP OVERVIEW', ''),
+        ('Destination', city_name),
+        ('Duration', f"{num_days} Days"),
+        ('Travelers', f"{plan.get('adults', 2)} Adults, {plan.get('children', 0)} Children"),
+        ('Budget', budget_text),
+        ('Activities Cost', format_currency(total_cost)),
+        ('Travel Cost', travel_cost_text) if travel_cost > 0 else None,
+        ('Hotel Cost', hotel_cost_text) if hotel_cost > 0 else None,
+        ('Grand Total', grand_total_text),
+        ('Remaining', remaining_text),
+        ('Budget Utilization', f"{utilization}%"),
+        ('Preferences', ', '.join(plan.get('preferences', [])).title()),
+    ) if row is not None]
     
     overview_table = Table(overview_data, colWidths=[3*inch, 4*inch])
-    overview_table.setStyle(TableStyle([
-        # Header row
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2C4A52')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 14),
-        ('SPAN', (0, 0), (-1, 0)),
-        ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 15),
-        ('TOPPADDING', (0, 0), (-1, 0), 15),
-        # Label column
-        ('BACKGROUND', (0, 1), (0, -1), colors.HexColor('#f8f9fa')),
-        ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 1), (-1, -1), 11),
-        # Grid
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#dee2e6')),
-        ('PADDING', (0, 0), (-1, -1), 12),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        # Alternating row colors
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f8f9fa')]),
-    ]))
+    overview_table.setStyle(_OVERVIEW_TABLE_STYLE)
     
     elements.append(overview_table)
     elements.append(Spacer(1, 25))
@@ -153,156 +274,67 @@ def generate_pdf(plan: dict) -> io.BytesIO:
     # ========== TRIP SUMMARY ==========
     summary = plan.get('summary', '')
     if summary:
-        elements.append(Paragraph("Trip Summary", heading_style))
-        
-        summary_box_style = ParagraphStyle(
-            'SummaryBox',
-            parent=styles['Normal'],
-            fontSize=11,
-            fontName='Helvetica-Oblique',
-            textColor=colors.HexColor('#495057'),
-            leftIndent=20,
-            rightIndent=20,
-            spaceBefore=10,
-            spaceAfter=10,
-            leading=16
-        )
-        elements.append(Paragraph(summary.replace('"', '').strip(), summary_box_style))
+        elements.append(Paragraph("Trip Summary", _HEADING_STYLE))
+        elements.append(Paragraph(summary.replace('"', '').strip(), _SUMMARY_BOX_STYLE))
         elements.append(Spacer(1, 15))
     
     # ========== DAILY ITINERARY ==========
-    elements.append(Paragraph("Daily Itinerary", heading_style))
+    elements.append(Paragraph("Daily Itinerary", _HEADING_STYLE))
     elements.append(Spacer(1, 10))
     
-    for day in plan.get('days', []):
+    for day, day_cost_text in zip(days, day_cost_texts):
         day_num = day.get('day_number', 0)
-        day_cost = day.get('total_cost', 0)
         
         # Day Header
-        day_header_data = [[f"DAY {day_num}", format_currency(day_cost)]]
+        day_header_data = [[f"DAY {day_num}", day_cost_text]]
         day_header_table = Table(day_header_data, colWidths=[5.5*inch, 1.5*inch])
-        day_header_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#537A82')),
-            ('TEXTCOLOR', (0, 0), (-1, -1), colors.white),
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (0, 0), 14),
-            ('FONTSIZE', (1, 0), (1, 0), 12),
-            ('ALIGN', (0, 0), (0, 0), 'LEFT'),
-            ('ALIGN', (1, 0), (1, 0), 'RIGHT'),
-            ('PADDING', (0, 0), (-1, -1), 12),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('ROUNDEDCORNERS', [5, 5, 0, 0]),
-        ]))
+        day_header_table.setStyle(_DAY_HEADER_TABLE_STYLE)
         elements.append(day_header_table)
         
         # Activities Table
-        activity_data = [['Time', 'Activity', 'Hours', 'Cost']]
-        
-        for activity in day.get('activities', []):
-            time_slot = activity.get('time_slot', 'morning').capitalize()
-            name = activity.get('name', 'Activity')
-            desc = activity.get('description', '')
-            if len(desc) > 60:
-                desc = desc[:60] + "..."
-            
-            activity_text = f"<b>{name}</b><br/><font size='9' color='#6c757d'>{desc}</font>"
-            
-            activity_data.append([
-                time_slot,
-                Paragraph(activity_text, styles['Normal']),
-                f"{activity.get('duration_hours', 0)}h",
-                format_currency(activity.get('cost', 0))
-            ])
+        activity_data = [_ACTIVITY_HEADER_ROW]
+        activity_data.extend(map(_activity_row, day.get('activities', [])))
         
         activity_table = Table(activity_data, colWidths=[1*inch, 4*inch, 0.8*inch, 1.2*inch])
-        activity_table.setStyle(TableStyle([
-            # Header
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#e9ecef')),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor('#495057')),
-            # Body
-            ('FONTSIZE', (0, 1), (-1, -1), 10),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#dee2e6')),
-            ('PADDING', (0, 0), (-1, -1), 10),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('ALIGN', (2, 0), (2, -1), 'CENTER'),
-            ('ALIGN', (3, 0), (3, -1), 'RIGHT'),
-            # Alternating rows
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f8f9fa')]),
-        ]))
+        activity_table.setStyle(_ACTIVITY_TABLE_STYLE)
         elements.append(activity_table)
         elements.append(Spacer(1, 20))
     
     # ========== COST BREAKDOWN ==========
-    elements.append(Paragraph("Cost Breakdown", heading_style))
+    elements.append(Paragraph("Cost Breakdown", _HEADING_STYLE))
     elements.append(Spacer(1, 10))
     
-    cost_data = [['Item', 'Amount']]
-    
-    # Add travel if present
-    if travel_cost > 0:
-        travel_details = plan.get('travel_details', 'Travel')
-        cost_data.append(['Travel: ' + travel_details, format_currency(travel_cost)])
-    
-    # Add hotel if present
-    if hotel_cost > 0:
-        hotel_details = plan.get('hotel_details', 'Hotel')
-        cost_data.append(['Hotel: ' + hotel_details, format_currency(hotel_cost)])
+    cost_data = [row for row in (
+        ('Item', 'Amount'),
+        ('Travel: ' + plan.get('travel_details', 'Travel'), travel_cost_text) if travel_cost > 0 else None,
+        ('Hotel: ' + plan.get('hotel_details', 'Hotel'), hotel_cost_text) if hotel_cost > 0 else None,
+    ) if row is not None]
     
     # Add daily costs
-    for day in plan.get('days', []):
-        cost_data.append([f"Day {day.get('day_number', 0)} Activities", format_currency(day.get('total_cost', 0))])
+    cost_data += [
+        (f"Day {day.get('day_number', 0)} Activities", day_cost_text)
+        for day, day_cost_text in zip(days, day_cost_texts)
+    ]
     
     # Totals
-    cost_data.append(['', ''])
-    cost_data.append(['GRAND TOTAL', format_currency(grand_total)])
-    cost_data.append(['BUDGET', format_currency(budget)])
-    cost_data.append(['REMAINING', format_currency(remaining)])
+    cost_data += (
+        ('', ''),
+        ('GRAND TOTAL', grand_total_text),
+        ('BUDGET', budget_text),
+        ('REMAINING', remaining_text),
+    )
     
     cost_table = Table(cost_data, colWidths=[4.5*inch, 2.5*inch])
-    cost_table.setStyle(TableStyle([
-        # Header
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#28a745')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 11),
-        # Totals section
-        ('FONTNAME', (0, -3), (-1, -1), 'Helvetica-Bold'),
-        ('BACKGROUND', (0, -3), (-1, -1), colors.HexColor('#d4edda')),
-        ('FONTSIZE', (0, -3), (-1, -1), 11),
-        # Grid
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#dee2e6')),
-        ('PADDING', (0, 0), (-1, -1), 10),
-        ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-        # Alternating rows
-        ('ROWBACKGROUNDS', (0, 1), (-1, -4), [colors.white, colors.HexColor('#f8f9fa')]),
-    ]))
+    cost_table.setStyle(_COST_TABLE_STYLE)
     elements.append(cost_table)
     
     # ========== FOOTER ==========
     elements.append(Spacer(1, 40))
-    elements.append(HRFlowable(width="100%", thickness=1, color=colors.HexColor('#dee2e6')))
+    elements.append(HRFlowable(width="100%", thickness=1, color=_COLOR_GRID))
     elements.append(Spacer(1, 15))
     
-    footer_style = ParagraphStyle(
-        'Footer',
-        parent=styles['Normal'],
-        fontSize=9,
-        alignment=TA_CENTER,
-        textColor=colors.HexColor('#6c757d'),
-        fontName='Helvetica'
-    )
-    
-    generation_date = datetime.now().strftime('%B %d, %Y at %I:%M %p')
-    elements.append(Paragraph(
-        f"Generated by AI Travel Planner | {generation_date}",
-        footer_style
-    ))
-    elements.append(Paragraph(
-        "Powered by DeepSeek AI",
-        footer_style
-    ))
+    elements.append(Paragraph(_FOOTER_GENERATED.format(datetime.now()), _FOOTER_STYLE))
+    elements.append(Paragraph(_FOOTER_POWERED_BY, _FOOTER_STYLE))
     
     # Build PDF
     doc.build(elements)
@@ -0,0 +1,54 @@
+"""
+Serialization Utilities
+========================
+Fast JSON encoding/decoding backed by orjson when it is installed.
+"""
+
+from operator import attrgetter
+
+from flask import current_app, jsonify, request
+
+from .cost_calculator import ACTIVITY_EMOJIS, DEFAULT_ACTIVITY_EMOJI
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Activity fields copied verbatim into the /plan response
+_ACTIVITY_FIELDS = ('name', 'description', 'duration_hours', 'cost', 'activity_type', 'time_slot')
+_get_activity_fields = attrgetter(*_ACTIVITY_FIELDS)
+
+
+def json_response(payload, status: int = 200):
+    """Build a JSON response, using orjson when available"""
+    if orjson is None:
+        return jsonify(payload), status
+    return current_app.response_class(
+        orjson.dumps(payload),
+        status=status,
+        mimetype='application/json'
+    )
+
+
+def json_body():
+    """Parse the current request's JSON body, using orjson when available.
+    
+    Returns None when the body is empty or not valid JSON.
+    """
+    if orjson is None:
+        return request.get_json(silent=True)
+    body = request.get_data(cache=False)
+    if not body:
+        return None
+    try:
+        return orjson.loads(body)
+    except orjson.JSONDecodeError:
+        return None
+
+
+def activity_to_dict(activity, emojis=ACTIVITY_EMOJIS, default_emoji=DEFAULT_ACTIVITY_EMOJI) -> dict:
+    """Convert an Activity into its JSON-ready response shape"""
+    activity_data = dict(zip(_ACTIVITY_FIELDS, _get_activity_fields(activity)))
+    activity_data['emoji'] = emojis.get(activity.activity_type, default_emoji)
+    return activity_data
@@ -35,8 +35,12 @@ if not OPENROUTER_API_KEY:
 # Model Configuration
 DEFAULT_MODEL = os.environ.get('DEFAULT_MODEL', 'xiaomi/mimo-v2-flash:free')
 
+# Model cascade: initial plans use the cheap model, replans escalate to the strong one
+CHEAP_MODEL = os.environ.get('CHEAP_MODEL', DEFAULT_MODEL)
+STRONG_MODEL = os.environ.get('STRONG_MODEL', 'nex-agi/deepseek-v3.1-nex-n1:free')
+
 # Application Settings
-DEBUG = os.environ.get('DEBUG', 'True').lower() == 'true'
+DEBUG = os.environ.get('DEBUG', 'False').lower() == 'true'
 PORT = int(os.environ.get('PORT', 5000))
 SECRET_KEY = os.environ.get('SECRET_KEY', 'travel-planner-secret-key-2024')
 
@@ -46,3 +50,25 @@ HOURS_PER_DAY = 10
 BUDGET_UTILIZATION_TARGET = 0.85
 MIN_DAILY_SPEND_RATIO = 0.50
 MAX_TOKENS = 800
+MAX_CONCURRENT_LLM_CALLS = int(os.environ.get('MAX_CONCURRENT_LLM_CALLS', 7))
+MAX_PREVIOUS_ACTIVITIES = 8  # Recent activity names sent to avoid repeats
+# Retries on 429/5xx/connection errors, with jittered exponential backoff
+LLM_MAX_RETRIES = int(os.environ.get('LLM_MAX_RETRIES', 3))
+
+# HTTP Connection Pool Settings
+HTTP_MAX_CONNECTIONS = 20
+HTTP_KEEPALIVE_EXPIRY = 60  # seconds
+
+# Completion Cache Settings
+LLM_CACHE_SIZE = int(os.environ.get('LLM_CACHE_SIZE', 1024))
+LLM_CACHE_TTL = int(os.environ.get('LLM_CACHE_TTL', 3600))  # seconds
+BUDGET_CACHE_BUCKET = 500  # ₹ granularity used when building cacheable prompts
+FALLBACK_BUDGET_BUCKET = 1000  # ₹ granularity for memoized fallback activities
+
+# PDF Cache Settings
+PDF_CACHE_SIZE = 64  # rendered itineraries kept in memory
+PDF_CACHE_TTL = int(os.environ.get('PDF_CACHE_TTL', 3600))  # seconds, Redis copies only
+
+# Shared Cache Settings (optional)
+# When set, completions and rendered PDFs are shared across workers via Redis
+REDIS_URL = os.environ.get('REDIS_URL', '')
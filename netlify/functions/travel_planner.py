@@ -0,0 +1,1000 @@
+"""
+Travel Planner Agent with Budget Constraints
+=============================================
+An agentic AI system that creates travel itineraries using LLM models.
+Features:
+- Breaks plans into days
+- Allocates activities within time + budget constraints
+- Re-plans if budget is exceeded
+- Generates final itinerary + cost breakdown
+
+Requirements:
+- pip install openai python-dotenv
+- OpenRouter API key (set in .env file)
+"""
+
+import json
+import re
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import MappingProxyType
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Optional
+from enum import Enum
+
+# Use orjson for parsing model responses when available
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+try:
+    import httpx
+    from openai import OpenAI
+except ImportError:
+    print("Please install openai: pip install openai")
+    exit(1)
+
+# HTTP/2 lets concurrent day requests share one connection (needs h2)
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Load environment variables
+try:
+    from dotenv import load_dotenv
+    # Find .env file - check multiple locations
+    env_paths = [
+        Path(__file__).parent.parent.parent / '.env',  # hackathon/.env
+        Path(__file__).parent / '.env',  # netlify/functions/.env
+        Path.cwd() / '.env'  # Current working directory
+    ]
+    for env_path in env_paths:
+        if env_path.exists():
+            load_dotenv(env_path)
+            print(f"✅ Loaded env from: {env_path}")
+            break
+except ImportError:
+    pass
+
+# OpenRouter API Configuration - from environment variables
+OPENROUTER_API_KEY = os.environ.get('OPENROUTER_API_KEY')
+OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
+DEFAULT_MODEL = os.environ.get('DEFAULT_MODEL', 'xiaomi/mimo-v2-flash:free')
+MAX_CONCURRENT_LLM_CALLS = int(os.environ.get('MAX_CONCURRENT_LLM_CALLS', 7))
+LLM_MAX_RETRIES = int(os.environ.get('LLM_MAX_RETRIES', 3))
+
+if not OPENROUTER_API_KEY:
+    print("❌ WARNING: OPENROUTER_API_KEY not found in environment variables!")
+    print("   Please set it in your .env file or system environment.")
+
+# Used to pull the first JSON value out of free-form model responses
+_JSON_DECODER = json.JSONDecoder()
+_JSON_START_RE = re.compile(r'[\[{]')
+
+
+# ============================================================================
+# Data Models
+# ============================================================================
+
+# Slotted dataclasses are smaller and faster to access, but need Python 3.10+
+# (the Netlify function runtime is configured for 3.9)
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+class ActivityType(Enum):
+    SIGHTSEEING = "sightseeing"
+    ADVENTURE = "adventure"
+    CULTURAL = "cultural"
+    FOOD = "food"
+    RELAXATION = "relaxation"
+    SHOPPING = "shopping"
+    NIGHTLIFE = "nightlife"
+
+
+# Chronological order of time slots; unknown slots sort with the afternoon
+TIME_SLOT_ORDER = MappingProxyType({"morning": 0, "afternoon": 1, "evening": 2})
+
+# Horizontal rules for the printed itinerary
+_RULE = "=" * 70
+_THIN_RULE = "-" * 70
+
+ACTIVITY_EMOJI = MappingProxyType({
+    "sightseeing": "🏛️",
+    "adventure": "🎢",
+    "cultural": "🎭",
+    "food": "🍽️",
+    "relaxation": "🧘",
+    "shopping": "🛍️",
+    "nightlife": "🌙"
+})
+DEFAULT_ACTIVITY_EMOJI = "📍"
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class Activity:
+    """Represents a single activity in the itinerary"""
+    name: str
+    description: str
+    duration_hours: float
+    cost: float
+    activity_type: str
+    time_slot: str  # morning, afternoon, evening
+
+
+def sort_by_time_slot(activities: list[Activity]) -> list[Activity]:
+    """Activities in chronological time-slot order, stable within a slot.
+    
+    Three fixed slots, so bucketing is a single pass with no key calls.
+    """
+    buckets = ([], [], [])
+    for activity in activities:
+        buckets[TIME_SLOT_ORDER.get(activity.time_slot, 1)].append(activity)
+    return buckets[0] + buckets[1] + buckets[2]
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class DayPlan:
+    """Represents a single day's plan"""
+    day_number: int
+    activities: list[Activity] = field(default_factory=list)
+    total_cost: float = 0.0
+    total_hours: float = 0.0
+    
+    def add_activity(self, activity: Activity):
+        self.activities.append(activity)
+        self.total_cost += activity.cost
+        self.total_hours += activity.duration_hours
+    
+    def set_activities(self, activities: list[Activity]):
+        """Replace the activities and recompute both totals in one pass"""
+        total_cost = 0.0
+        total_hours = 0.0
+        for activity in activities:
+            total_cost += activity.cost
+            total_hours += activity.duration_hours
+        self.activities = activities
+        self.total_cost = total_cost
+        self.total_hours = total_hours
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class TravelPlan:
+    """Complete travel plan with all days"""
+    city: str
+    budget: float
+    num_days: int
+    preferences: list[str]
+    days: list[DayPlan] = field(default_factory=list)
+    total_cost: float = 0.0
+    
+    def add_day(self, day: DayPlan):
+        self.days.append(day)
+        self.total_cost += day.total_cost
+    
+    def calculate_total_cost(self) -> float:
+        # Kept up to date by add_day and the global budget optimization
+        return self.total_cost
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class UserInput:
+    """User input for travel planning"""
+    budget: float
+    num_days: int
+    city: str
+    activity_preferences: list[str]
+
+
+# ============================================================================
+# LLM Model Interface (OpenRouter)
+# ============================================================================
+
+class _JsonCompletionTracker:
+    """Detects, chunk by chunk, when the first top-level JSON value closes"""
+    
+    __slots__ = ('depth', 'started', 'in_string', 'escaped')
+    
+    def __init__(self):
+        self.depth = 0
+        self.started = False
+        self.in_string = False
+        self.escaped = False
+    
+    def feed(self, text: str) -> bool:
+        for ch in text:
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif ch == '\\':
+                    self.escaped = True
+                elif ch == '"':
+                    self.in_string = False
+            elif ch in '{[':
+                self.depth += 1
+                self.started = True
+            elif not self.started:
+                continue
+            elif ch == '"':
+                self.in_string = True
+            elif ch in '}]':
+                self.depth -= 1
+                if self.depth == 0:
+                    return True
+        return False
+
+
+@lru_cache(maxsize=None)
+def _get_openai_client(base_url: str, api_key: str) -> OpenAI:
+    """One OpenAI client per warm function instance, so the pool survives invocations"""
+    return OpenAI(
+        base_url=base_url,
+        api_key=api_key,
+        # Transient rate limits and server errors are retried by the SDK
+        # before a call gives up and the fallback activities are used
+        max_retries=LLM_MAX_RETRIES,
+        # Keep connections to OpenRouter warm between requests
+        http_client=httpx.Client(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=MAX_CONCURRENT_LLM_CALLS * 2,
+                max_keepalive_connections=MAX_CONCURRENT_LLM_CALLS * 2,
+                keepalive_expiry=60
+            )
+        ),
+    )
+
+
+class LlamaAgent:
+    """Interface to interact with LLM models via OpenRouter API"""
+    
+    def __init__(self, model_name: str = None):
+        self.model_name = model_name or DEFAULT_MODEL
+        self.conversation_history = []
+        self._system_message = None
+        self.client = _get_openai_client(OPENROUTER_BASE_URL, OPENROUTER_API_KEY)
+        
+    def _build_messages(self, prompt: str, system_prompt: Optional[str]) -> list[dict]:
+        """Chat messages for a prompt; the system message is built once per prompt text"""
+        user_message = {"role": "user", "content": prompt}
+        if not system_prompt:
+            return [user_message]
+        system_message = self._system_message
+        if system_message is None or system_message["content"] is not system_prompt:
+            system_message = {"role": "system", "content": system_prompt}
+            self._system_message = system_message
+        return [system_message, user_message]
+    
+    def stream_query(self, prompt: str, system_prompt: str = None, max_tokens: int = 800) -> str:
+        """Stream a query and stop reading once the first JSON value is complete.
+        
+        Anything the model writes after the value is discarded by
+        extract_json anyway, so there is no reason to wait for it.
+        """
+        messages = self._build_messages(prompt, system_prompt)
+        
+        try:
+            stream = self.client.chat.completions.create(
+                model=self.model_name,
+                messages=messages,
+                temperature=0.7,
+                max_tokens=max_tokens,
+                stream=True
+            )
+            tracker = _JsonCompletionTracker()
+            parts = []
+            with stream:
+                for chunk in stream:
+                    if not chunk.choices:
+                        continue
+                    text = chunk.choices[0].delta.content
+                    if not text:
+                        continue
+                    parts.append(text)
+                    if tracker.feed(text):
+                        break
+            return "".join(parts) or None
+        except Exception as e:
+            print(f"Error querying LLM model: {e}")
+            return None
+    
+    def extract_json(self, response: str) -> Optional[dict]:
+        """Extract the first JSON object from a model response.
+        
+        Returns None when the response holds no object; bare scalars and
+        arrays are never returned, so callers can index the result.
+        """
+        try:
+            # Responses are usually the bare JSON object
+            data = json_loads(response)
+            if isinstance(data, dict):
+                return data
+        except json.JSONDecodeError:
+            pass
+        
+        # Decode from each opening brace/bracket in turn; the decoder stops at
+        # the end of the first complete value, so trailing text and stray
+        # braces after it are never scanned and nothing backtracks
+        match = _JSON_START_RE.search(response)
+        while match:
+            try:
+                data = _JSON_DECODER.raw_decode(response, match.start())[0]
+                if isinstance(data, dict):
+                    return data
+            except json.JSONDecodeError:
+                pass
+            match = _JSON_START_RE.search(response, match.start() + 1)
+        return None
+
+
+# ============================================================================
+# Travel Planner Agent
+# ============================================================================
+
+SYSTEM_PROMPT = """You are a travel planner. Respond ONLY with valid JSON. Create premium activities in Indian Rupees (₹).
+JSON format: {"activities": [{"name": "string", "description": "short", "duration_hours": float, "cost": float, "activity_type": "sightseeing|adventure|cultural|food|relaxation|shopping|nightlife", "time_slot": "morning|afternoon|evening"}]}"""
+
+# Prompt templates, filled with str.format_map
+DAY_PROMPT_TEMPLATE = """Day {day} in {city}. Budget: ₹{budget:.0f}. Preferences: {preferences}. {hours}h available.{previous}
+Generate 3-4 activities. Respond with JSON only: {{"activities": [{{"name": "string", "description": "short", "duration_hours": float, "cost": float, "activity_type": "string", "time_slot": "morning|afternoon|evening"}}]}}"""
+
+ITINERARY_PROMPT_TEMPLATE = """{num_days}-day trip to {city}. Budget per day: ₹{budget:.0f}. Preferences: {preferences}. {hours}h available per day.
+Generate 3-4 activities for each day without repeating activities across days. Respond with JSON only: {{"days": [{{"day": 1, "activities": [...]}}, ...]}} covering days 1-{num_days}."""
+
+REPLAN_PROMPT_TEMPLATE = """The previous plan for Day {day} in {city} failed validation.
+        
+Error: {error}
+Previous plan cost: ${previous_cost:.2f}
+Previous plan hours: {previous_hours:.1f}h
+
+Create a NEW plan that:
+1. Stays strictly under ${budget:.2f} budget
+2. Uses maximum {hours} hours
+3. Includes 3-4 activities
+4. Matches preferences: {preferences}
+
+Respond ONLY with valid JSON:
+{{
+    "activities": [
+        {{
+            "name": "Activity Name",
+            "description": "Brief description",
+            "duration_hours": 2.0,
+            "cost": 30.0,
+            "activity_type": "sightseeing",
+            "time_slot": "morning"
+        }}
+    ]
+}}"""
+
+# Fallback activities used when the LLM fails: name and description templates
+# (filled with the city), hours, share of the daily budget, type and time slot
+_FALLBACK_TEMPLATE = (
+    ("Premium {city} Guided Tour",
+     "Expert-led tour of {city}'s top attractions with skip-the-line access",
+     3.0, 0.30, "sightseeing", "morning"),
+    ("Fine Dining at Top {city} Restaurant",
+     "Michelin-recommended restaurant experience with local specialties",
+     2.0, 0.25, "food", "afternoon"),
+    ("{city} Cultural Experience & Show",
+     "Traditional performance or cultural show unique to {city}",
+     2.5, 0.25, "cultural", "evening"),
+    ("Exclusive {city} Night Tour",
+     "Private evening tour showcasing {city}'s illuminated landmarks",
+     2.0, 0.20, "nightlife", "evening"),
+)
+
+
+class TravelPlannerAgent:
+    """
+    Agentic Travel Planner that uses planning → checking → re-planning loops
+    with rule-based constraints for budget and time management.
+    """
+    
+    def __init__(self, model_name: str = "nex-agi/deepseek-v3.1-nex-n1:free"):
+        self.llama = LlamaAgent(model_name)
+        self.max_replanning_attempts = 1  # Reduced for speed
+        self.hours_per_day = 10  # Available hours for activities per day
+        self.budget_utilization_target = 0.85  # Target 85% of budget
+        self.min_daily_spend_ratio = 0.50  # Reduced for flexibility
+        
+    def get_system_prompt(self) -> str:
+        """System prompt for the travel planning agent"""
+        return SYSTEM_PROMPT
+    
+    def generate_activities_for_day(
+        self, 
+        city: str, 
+        day_number: int, 
+        remaining_budget: float,
+        preferences: str,
+        previous_activities: str = ""
+    ) -> list[Activity]:
+        """Generate activities for a single day using Llama.
+        
+        preferences and previous_activities are comma-separated strings,
+        joined once per plan by the caller.
+        """
+        
+        previous_str = ""
+        if previous_activities:
+            previous_str = f"\nAvoid repeating these activities: {previous_activities}"
+        
+        # Calculate target daily spend (aim for 85% budget utilization)
+        target_daily_spend = remaining_budget * self.budget_utilization_target / max(1, (self.hours_per_day // 3))  # Rough days remaining estimate
+        if day_number == 1:
+            target_daily_spend = remaining_budget * self.budget_utilization_target / 3  # Assume 3-4 day trip on day 1
+        
+        prompt = DAY_PROMPT_TEMPLATE.format_map({
+            'day': day_number,
+            'city': city,
+            'budget': target_daily_spend,
+            'preferences': preferences,
+            'hours': self.hours_per_day,
+            'previous': previous_str
+        })
+        
+        response = self.llama.stream_query(prompt, self.get_system_prompt())
+        
+        if not response:
+            return self._get_fallback_activities(city, day_number, remaining_budget)
+        
+        # Parse the response
+        data = self.llama.extract_json(response)
+        
+        if not isinstance(data, dict) or not isinstance(data.get('activities'), list):
+            print(f"Warning: Could not parse activities for day {day_number}, using fallback")
+            return self._get_fallback_activities(city, day_number, remaining_budget)
+        
+        return self._parse_activities(data['activities'])
+    
+    def generate_all_days(
+        self, user_input: UserInput, daily_budget: float, preferences: str
+    ) -> dict[int, list[Activity]]:
+        """Generate activities for every day in a single LLM call.
+        
+        Returns a mapping of day number to activities; days the model
+        skipped or returned unparseable are left out for the caller to fill.
+        """
+        num_days = user_input.num_days
+        target_daily_spend = daily_budget * self.budget_utilization_target
+        
+        prompt = ITINERARY_PROMPT_TEMPLATE.format_map({
+            'num_days': num_days,
+            'city': user_input.city,
+            'budget': target_daily_spend,
+            'preferences': preferences,
+            'hours': self.hours_per_day
+        })
+        
+        response = self.llama.stream_query(prompt, self.get_system_prompt(), max_tokens=800 * num_days)
+        if not response:
+            return {}
+        
+        data = self.llama.extract_json(response)
+        if not isinstance(data, dict) or not isinstance(data.get('days'), list):
+            print("Warning: Could not parse full itinerary, planning days individually")
+            return {}
+        
+        itinerary = {}
+        for index, day_data in enumerate(data['days'], start=1):
+            if not isinstance(day_data, dict):
+                continue
+            try:
+                day_number = int(day_data.get('day', index))
+            except (TypeError, ValueError):
+                day_number = index
+            if 1 <= day_number <= num_days and day_number not in itinerary:
+                activities = self._parse_activities(day_data.get('activities') or [])
+                if activities:
+                    itinerary[day_number] = activities
+        
+        return itinerary
+    
+    def _parse_activities(self, items: list) -> list[Activity]:
+        """Build Activity objects from raw JSON, skipping malformed entries"""
+        if not isinstance(items, list):
+            return []
+        activities = []
+        for act_data in items:
+            try:
+                activities.append(Activity(
+                    name=act_data.get('name', 'Unknown Activity'),
+                    description=act_data.get('description', ''),
+                    duration_hours=float(act_data.get('duration_hours', 2.0)),
+                    cost=float(act_data.get('cost', 0.0)),
+                    activity_type=act_data.get('activity_type', 'sightseeing'),
+                    time_slot=act_data.get('time_slot', 'morning')
+                ))
+            except (AttributeError, KeyError, TypeError, ValueError) as e:
+                print(f"Warning: Could not parse activity: {e}")
+        return activities
+    
+    def _get_fallback_activities(self, city: str, day_number: int, budget: float) -> list[Activity]:
+        """Fallback activities if AI generation fails - Now with premium pricing"""
+        daily_budget = budget * self.budget_utilization_target / 3  # Target 85% utilization over 3 days
+        return [
+            Activity(
+                name=name.format(city=city),
+                description=description.format(city=city),
+                duration_hours=hours,
+                cost=daily_budget * share,
+                activity_type=activity_type,
+                time_slot=time_slot
+            )
+            for name, description, hours, share, activity_type, time_slot in _FALLBACK_TEMPLATE
+        ]
+    
+    def validate_day_plan(self, day: DayPlan, daily_budget: float) -> tuple[bool, str]:
+        """
+        Validate a day plan against constraints.
+        Returns (is_valid, error_message)
+        """
+        # Check budget constraint - allow up to 110% of daily budget
+        if day.total_cost > daily_budget * 1.10:
+            return False, f"Day {day.day_number} exceeds budget: ${day.total_cost:.2f} > ${daily_budget:.2f}"
+        
+        # Check MINIMUM spending - must spend at least 70% of daily budget
+        min_spend = daily_budget * self.min_daily_spend_ratio
+        if day.total_cost < min_spend:
+            return False, f"Day {day.day_number} underspends: ${day.total_cost:.2f} < ${min_spend:.2f} (minimum 70%)"
+        
+        # Check time constraint
+        if day.total_hours > self.hours_per_day:
+            return False, f"Day {day.day_number} exceeds time limit: {day.total_hours:.1f}h > {self.hours_per_day}h"
+        
+        # Check minimum activities
+        if len(day.activities) < 2:
+            return False, f"Day {day.day_number} has too few activities: {len(day.activities)}"
+        
+        return True, ""
+    
+    def optimize_day_plan(
+        self, 
+        day: DayPlan, 
+        daily_budget: float
+    ) -> DayPlan:
+        """Optimize a day plan to fit within constraints"""
+        
+        # Sort activities by preference score (keeping time slots in order)
+        activities = sort_by_time_slot(day.activities)
+        total_cost = day.total_cost
+        total_hours = day.total_hours
+        kept = len(activities)
+        dropped = set()
+        
+        # Remove the most expensive non-essential activities until within budget
+        expensive = [a for a in activities if a.cost > daily_budget * 0.3]
+        for activity in sorted(expensive, key=lambda x: x.cost, reverse=True):
+            if total_cost <= daily_budget or kept <= 2:
+                break
+            dropped.add(id(activity))
+            total_cost -= activity.cost
+            total_hours -= activity.duration_hours
+            kept -= 1
+        
+        # Remove the longest activities until within time limits
+        survivors = [a for a in activities if id(a) not in dropped]
+        for activity in sorted(survivors, key=lambda x: x.duration_hours, reverse=True):
+            if total_hours <= self.hours_per_day or kept <= 2:
+                break
+            dropped.add(id(activity))
+            total_cost -= activity.cost
+            total_hours -= activity.duration_hours
+            kept -= 1
+        
+        day.set_activities([a for a in activities if id(a) not in dropped])
+        return day
+    
+    def replan_day(
+        self, 
+        city: str, 
+        day_number: int, 
+        failed_plan: DayPlan,
+        remaining_budget: float,
+        preferences: str,
+        error_message: str
+    ) -> DayPlan:
+        """Re-plan a day that failed validation"""
+        
+        print(f"  🔄 Re-planning day {day_number}: {error_message}")
+        
+        prompt = REPLAN_PROMPT_TEMPLATE.format_map({
+            'day': day_number,
+            'city': city,
+            'error': error_message,
+            'previous_cost': failed_plan.total_cost,
+            'previous_hours': failed_plan.total_hours,
+            'budget': remaining_budget,
+            'hours': self.hours_per_day,
+            'preferences': preferences
+        })
+        
+        response = self.llama.stream_query(prompt, self.get_system_prompt())
+        
+        if not response:
+            # Return optimized version of failed plan
+            return self.optimize_day_plan(failed_plan, remaining_budget)
+        
+        data = self.llama.extract_json(response)
+        
+        if not isinstance(data, dict) or not isinstance(data.get('activities'), list):
+            return self.optimize_day_plan(failed_plan, remaining_budget)
+        
+        new_day = DayPlan(day_number=day_number)
+        new_day.set_activities(self._parse_activities(data['activities']))
+        return new_day
+    
+    def create_travel_plan(self, user_input: UserInput) -> TravelPlan:
+        """
+        Main planning loop with constraint checking and re-planning.
+        
+        This is the agentic loop that:
+        1. Plans each day
+        2. Validates against constraints
+        3. Re-plans if necessary
+        4. Optimizes the final itinerary
+        """
+        
+        print(f"\n{'='*60}")
+        print(f"🌍 TRAVEL PLANNER AGENT")
+        print(f"{'='*60}")
+        print(f"📍 City: {user_input.city}")
+        print(f"💰 Budget: ₹{user_input.budget:.0f}")
+        print(f"📅 Days: {user_input.num_days}")
+        # Joined once here and reused by every prompt for this plan
+        preferences_str = ', '.join(user_input.activity_preferences)
+        print(f"🎯 Preferences: {preferences_str}")
+        print(f"{'='*60}\n")
+        
+        travel_plan = TravelPlan(
+            city=user_input.city,
+            budget=user_input.budget,
+            num_days=user_input.num_days,
+            preferences=user_input.activity_preferences
+        )
+        
+        daily_budget_target = user_input.budget / user_input.num_days
+        day_numbers = range(1, user_input.num_days + 1)
+        
+        # Days are planned concurrently, so each day assumes the earlier
+        # days spent their target instead of waiting for their actual cost
+        def expected_remaining(day_num: int) -> float:
+            return user_input.budget - daily_budget_target * (day_num - 1)
+        
+        # ====== AGENTIC PLANNING LOOP ======
+        # Step 1: PLAN - Ask for the whole itinerary in one request
+        print(f"📅 Planning {user_input.num_days} days...")
+        print(f"   Target daily budget: ₹{daily_budget_target:.0f}")
+        itinerary = self.generate_all_days(user_input, daily_budget_target, preferences_str)
+        
+        with ThreadPoolExecutor(max_workers=min(user_input.num_days, MAX_CONCURRENT_LLM_CALLS)) as pool:
+            # Days missing from the combined response are planned individually, in parallel
+            activity_futures = {
+                day_num: pool.submit(
+                    self.generate_activities_for_day,
+                    city=user_input.city,
+                    day_number=day_num,
+                    remaining_budget=expected_remaining(day_num),
+                    preferences=preferences_str
+                )
+                for day_num in day_numbers
+                if day_num not in itinerary
+            }
+            
+            # Drop activities already planned on an earlier day, unless that
+            # would leave the day with fewer than two activities
+            seen_names = set()
+            day_plans = []
+            for day_num in day_numbers:
+                if day_num in itinerary:
+                    activities = itinerary[day_num]
+                else:
+                    activities = activity_futures[day_num].result()
+                fresh = [a for a in activities if a.name not in seen_names]
+                if len(fresh) >= 2:
+                    activities = fresh
+                seen_names.update(a.name for a in activities)
+                
+                day_plan = DayPlan(day_number=day_num)
+                for activity in activities:
+                    day_plan.add_activity(activity)
+                day_plans.append(day_plan)
+            
+            # Steps 2-3: CHECK and RE-PLAN each day concurrently
+            plan_futures = [
+                pool.submit(
+                    self._check_day_plan,
+                    user_input=user_input,
+                    preferences=preferences_str,
+                    day_plan=day_plan,
+                    remaining_budget=expected_remaining(day_plan.day_number),
+                    daily_budget_target=daily_budget_target
+                )
+                for day_plan in day_plans
+            ]
+            for future in plan_futures:
+                travel_plan.add_day(future.result())
+        
+        for day_plan in travel_plan.days:
+            print(f"   ✅ Day {day_plan.day_number} planned: {len(day_plan.activities)} activities, ₹{day_plan.total_cost:.0f}")
+        
+        # Final budget check and adjustment
+        if travel_plan.total_cost > user_input.budget:
+            print(f"\n⚠️ Total cost ₹{travel_plan.total_cost:.0f} exceeds budget ₹{user_input.budget:.0f}")
+            print("🔄 Applying global optimization...")
+            travel_plan = self._global_budget_optimization(travel_plan, user_input.budget)
+        
+        return travel_plan
+    
+    def create_fallback_plan(self, user_input: UserInput) -> TravelPlan:
+        """Build a plan from fallback activities without calling the LLM"""
+        travel_plan = TravelPlan(
+            city=user_input.city,
+            budget=user_input.budget,
+            num_days=user_input.num_days,
+            preferences=user_input.activity_preferences
+        )
+        
+        # _get_fallback_activities spreads its budget over three days, so hand
+        # it three days' worth to get each day's full share
+        fallback_budget = user_input.budget * 3 / user_input.num_days
+        for day_num in range(1, user_input.num_days + 1):
+            day_plan = DayPlan(day_number=day_num)
+            for activity in self._get_fallback_activities(user_input.city, day_num, fallback_budget):
+                day_plan.add_activity(activity)
+            travel_plan.add_day(day_plan)
+        
+        return travel_plan
+    
+    def _check_day_plan(
+        self,
+        user_input: UserInput,
+        preferences: str,
+        day_plan: DayPlan,
+        remaining_budget: float,
+        daily_budget_target: float
+    ) -> DayPlan:
+        """Validate a day plan, re-planning and optimizing it if needed"""
+        day_num = day_plan.day_number
+        
+        # Step 2: CHECK - Validate against constraints
+        is_valid, error_message = self.validate_day_plan(day_plan, daily_budget_target)
+        
+        # Step 3: RE-PLAN if needed
+        replan_attempts = 0
+        while not is_valid and replan_attempts < self.max_replanning_attempts:
+            replan_attempts += 1
+            day_plan = self.replan_day(
+                city=user_input.city,
+                day_number=day_num,
+                failed_plan=day_plan,
+                remaining_budget=min(remaining_budget, daily_budget_target * 1.2),
+                preferences=preferences,
+                error_message=error_message
+            )
+            is_valid, error_message = self.validate_day_plan(day_plan, daily_budget_target)
+        
+        # Final optimization if still invalid
+        if not is_valid:
+            print(f"   ⚠️ Applying final optimization for day {day_num}")
+            day_plan = self.optimize_day_plan(day_plan, daily_budget_target)
+        
+        return day_plan
+    
+    def _global_budget_optimization(self, plan: TravelPlan, budget: float) -> TravelPlan:
+        """Optimize the entire plan to fit within the global budget"""
+        if plan.total_cost <= budget:
+            return plan
+        
+        # Find activities that can be removed, most expensive first
+        all_activities = [(day, activity) for day in plan.days for activity in day.activities]
+        all_activities.sort(key=lambda x: x[1].cost, reverse=True)
+        
+        kept = {id(day): len(day.activities) for day in plan.days}
+        dropped = set()
+        
+        # Remove expensive activities until within budget
+        for day, activity in all_activities:
+            if plan.total_cost <= budget:
+                break
+            if kept[id(day)] > 2:  # Keep at least 2 activities per day
+                kept[id(day)] -= 1
+                dropped.add(id(activity))
+                plan.total_cost -= activity.cost
+        
+        # Apply the removals in one pass per day
+        if dropped:
+            for day in plan.days:
+                day.set_activities([a for a in day.activities if id(a) not in dropped])
+        
+        return plan
+    
+    def generate_itinerary_summary(self, plan: TravelPlan) -> str:
+        """Generate a quick summary without extra API call for speed"""
+        
+        # Get unique activity types
+        activity_types = set()
+        activity_names = []
+        for day in plan.days:
+            for act in day.activities:
+                activity_types.add(act.activity_type)
+                activity_names.append(act.name)
+        
+        # Generate quick local summary
+        highlights = activity_names[:3] if len(activity_names) >= 3 else activity_names
+        types_str = ", ".join(list(activity_types)[:3])
+        
+        savings = plan.budget - plan.total_cost
+        if savings > 0:
+            budget_msg = f"You'll save ₹{savings:.0f} from your budget!"
+        else:
+            budget_msg = "Your budget is fully optimized for this trip!"
+        
+        return f"Get ready for an amazing {plan.num_days}-day adventure in {plan.city}! Experience {types_str} with highlights like {', '.join(highlights)}. {budget_msg}"
+    
+    def print_itinerary(self, plan: TravelPlan):
+        """Print a beautifully formatted itinerary"""
+        # Collected and written once rather than one print() per line
+        lines = []
+        
+        lines.append(f"\n{_RULE}")
+        lines.append(f"{'🌴 FINAL TRAVEL ITINERARY 🌴':^70}")
+        lines.append(_RULE)
+        lines.append(f"\n📍 Destination: {plan.city}")
+        lines.append(f"💰 Budget: ₹{plan.budget:.0f}")
+        lines.append(f"📅 Duration: {plan.num_days} days")
+        lines.append(f"🎯 Preferences: {', '.join(plan.preferences)}")
+        lines.append(f"\n{_THIN_RULE}")
+        
+        for day in plan.days:
+            lines.append(f"\n{'📅 DAY ' + str(day.day_number):=^70}")
+            lines.append(f"{'Daily Budget: ₹' + f'{day.total_cost:.0f}':^70}")
+            lines.append(_THIN_RULE)
+            
+            # Sort activities by time slot
+            sorted_activities = sort_by_time_slot(day.activities)
+            
+            for activity in sorted_activities:
+                emoji = self._get_activity_emoji(activity.activity_type)
+                lines.append(f"\n  {emoji} {activity.name}")
+                lines.append(f"     ⏰ Time: {activity.time_slot.capitalize()} ({activity.duration_hours}h)")
+                lines.append(f"     💵 Cost: ₹{activity.cost:.0f}")
+                lines.append(f"     📝 {activity.description}")
+        
+        # Cost Breakdown
+        lines.append(f"\n{_RULE}")
+        lines.append(f"{'💰 COST BREAKDOWN 💰':^70}")
+        lines.append(_RULE)
+        
+        for day in plan.days:
+            lines.append(f"  Day {day.day_number}: ₹{day.total_cost:.0f}")
+        
+        lines.append(f"  {'-'*40}")
+        lines.append(f"  {'TOTAL':.<35} ₹{plan.total_cost:.0f}")
+        lines.append(f"  {'BUDGET':.<35} ₹{plan.budget:.0f}")
+        lines.append(f"  {'REMAINING':.<35} ₹{plan.budget - plan.total_cost:.0f}")
+        
+        if plan.total_cost <= plan.budget:
+            lines.append(f"\n  ✅ Within budget! You have ₹{plan.budget - plan.total_cost:.0f} to spare!")
+        else:
+            lines.append(f"\n  ⚠️ Over budget by ₹{plan.total_cost - plan.budget:.0f}")
+        
+        # Generate AI summary
+        lines.append(f"\n{_RULE}")
+        lines.append(f"{'✨ TRIP SUMMARY ✨':^70}")
+        lines.append(_RULE)
+        summary = self.generate_itinerary_summary(plan)
+        lines.append(f"\n{summary}")
+        lines.append(f"\n{_RULE}")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
+    
+    def _get_activity_emoji(self, activity_type: str) -> str:
+        """Get an emoji for the activity type"""
+        return ACTIVITY_EMOJI.get(activity_type, DEFAULT_ACTIVITY_EMOJI)
+
+
+# ============================================================================
+# Interactive CLI Interface
+# ============================================================================
+
+def get_user_input() -> UserInput:
+    """Interactive CLI to get user input"""
+    
+    print("\n" + "="*60)
+    print("🌍 WELCOME TO AI TRAVEL PLANNER 🌍".center(60))
+    print("="*60)
+    print("\nPowered by Llama AI - Let's plan your perfect trip!\n")
+    
+    # Get budget
+    while True:
+        try:
+            budget = float(input("💰 Enter your total budget (in ₹ INR): ₹"))
+            if budget > 0:
+                break
+            print("Please enter a positive amount.")
+        except ValueError:
+            print("Please enter a valid number.")
+    
+    # Get number of days
+    while True:
+        try:
+            num_days = int(input("📅 Enter number of days: "))
+            if 1 <= num_days <= 30:
+                break
+            print("Please enter between 1 and 30 days.")
+        except ValueError:
+            print("Please enter a valid number.")
+    
+    # Get city
+    city = input("📍 Enter your destination city: ").strip()
+    while not city:
+        city = input("Please enter a valid city name: ").strip()
+    
+    # Get preferences
+    print("\n🎯 Activity Preferences (choose from the list):")
+    print("   1. Sightseeing    2. Adventure    3. Cultural")
+    print("   4. Food           5. Relaxation   6. Shopping")
+    print("   7. Nightlife")
+    
+    pref_input = input("\nEnter preference numbers separated by commas (e.g., 1,3,4): ").strip()
+    
+    pref_map = {
+        "1": "sightseeing",
+        "2": "adventure", 
+        "3": "cultural",
+        "4": "food",
+        "5": "relaxation",
+        "6": "shopping",
+        "7": "nightlife"
+    }
+    
+    preferences = []
+    for p in pref_input.split(","):
+        p = p.strip()
+        if p in pref_map:
+            preferences.append(pref_map[p])
+    
+    if not preferences:
+        preferences = ["sightseeing", "food", "cultural"]  # Default preferences
+    
+    return UserInput(
+        budget=budget,
+        num_days=num_days,
+        city=city,
+        activity_preferences=preferences
+    )
+
+
+def main():
+    """Main entry point"""
+    
+    print("\n" + "="*60)
+    print("🌍 AI TRAVEL PLANNER AGENT 🌍".center(60))
+    print("="*60)
+    print("\nChoose an option:")
+    print("  1. Interactive Mode (Enter your own travel details)")
+    print("  2. Exit")
+    
+    choice = input("\nEnter your choice (1/2): ").strip()
+    
+    if choice == "1":
+        user_input = get_user_input()
+        agent = TravelPlannerAgent()  # Uses OpenRouter with Llama 3.3
+        travel_plan = agent.create_travel_plan(user_input)
+        agent.print_itinerary(travel_plan)
+        
+    elif choice == "2":
+        print("\n👋 Goodbye! Happy travels!")
+        return
+    else:
+        print("Invalid choice. Please run the program again.")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@
 Travel Planner Application - Entry Point
 ==========================================
 Run this file to start the Flask development server.
+For production, serve `run:app` with gunicorn instead (see README).
 """
 
 import os
@@ -22,4 +23,4 @@ if __name__ == '__main__':
     print("📝 Open this URL in your browser to use the Travel Planner")
     print("\nPress CTRL+C to stop the server\n")
     
-    app.run(debug=DEBUG, port=PORT, host='0.0.0.0')
+    app.run(debug=DEBUG, port=PORT, host='0.0.0.0', threaded=True)